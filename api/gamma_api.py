@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import config
@@ -57,19 +58,29 @@ class GammaApiClient(BaseApiClient):
         self,
         end_date_min: str | None = None,
         max_results: int = 10000,
+        concurrency: int = 1,
     ) -> list[dict]:
-        """Paginate through all closed markets."""
+        """Paginate through all closed markets.
+
+        Pages are requested in waves of ``concurrency`` offsets at a time; the
+        first short or empty page in a wave ends pagination.
+        """
         all_markets: list[dict] = []
         offset = 0
         page_size = 100
         while offset < max_results:
-            batch = await self.get_closed_markets(
-                limit=page_size, offset=offset, end_date_min=end_date_min,
-            )
-            if not batch:
-                break
-            all_markets.extend(batch)
-            if len(batch) < page_size:
+            offsets = range(offset, min(offset + page_size * concurrency, max_results), page_size)
+            batches = await asyncio.gather(*[
+                self.get_closed_markets(limit=page_size, offset=o, end_date_min=end_date_min)
+                for o in offsets
+            ])
+            done = False
+            for batch in batches:
+                all_markets.extend(batch)
+                if len(batch) < page_size:
+                    done = True
+                    break
+            if done:
                 break
-            offset += page_size
+            offset += page_size * len(offsets)
         return all_markets[:max_results]
@@ -13,7 +13,7 @@ import config
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketInfo:
     """Parsed market data from CLOB API."""
 
@@ -26,7 +26,7 @@ class MarketInfo:
     neg_risk: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderResult:
     """Result of a placed order."""
 
@@ -90,12 +90,15 @@ class ClobTradingClient:
             if not market:
                 return None
 
-            tokens = market.get("tokens", [])
-            token_id = None
-            for t in tokens:
-                if t.get("outcome", "").upper() == direction.upper():
-                    token_id = t["token_id"]
-                    break
+            outcome = direction.upper()
+            token_id = next(
+                (
+                    t["token_id"]
+                    for t in market.get("tokens", [])
+                    if t.get("outcome", "").upper() == outcome
+                ),
+                None,
+            )
 
             if not token_id:
                 return None
@@ -103,7 +106,7 @@ class ClobTradingClient:
             return MarketInfo(
                 condition_id=condition_id,
                 token_id=token_id,
-                outcome=direction.upper(),
+                outcome=outcome,
                 accepting_orders=bool(market.get("accepting_orders", False)),
                 minimum_order_size=float(market.get("minimum_order_size", 0)),
                 minimum_tick_size=float(market.get("minimum_tick_size", 0.01)),
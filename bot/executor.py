@@ -4,6 +4,7 @@ Wires together signal consumption, risk checks, order placement,
 DB logging, and Telegram notifications.
 """
 
+import asyncio
 import json
 import logging
 from datetime import datetime, date
@@ -225,11 +226,12 @@ class BotExecutor:
             )
             return "skipped"
 
-        # Step 3: Get current price for slippage check
-        current_price = await self._clob.get_current_price(market_info.token_id)
-
-        # Step 4: Get balance
-        balance = await self._clob.get_balance()
+        # Steps 3-4: Current price (for slippage check) and balance are
+        # independent round-trips, so fetch them concurrently
+        current_price, balance = await asyncio.gather(
+            self._clob.get_current_price(market_info.token_id),
+            self._clob.get_balance(),
+        )
 
         # Step 5: Risk checks
         allowed, reason = self.risk_manager.check_all(signal, balance, current_price)
@@ -125,7 +125,8 @@ _INDEXES = [
 
 
 def _get_connection(db_path: str) -> sqlite3.Connection:
-    conn = sqlite3.connect(db_path)
+    # uri=True so "file:...?mode=memory" paths work; plain paths are unaffected
+    conn = sqlite3.connect(db_path, uri=True)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
@@ -151,42 +152,59 @@ def init_db(db_path: str) -> None:
 
 # --------------- traders ---------------
 
+_UPSERT_TRADER_SQL = """
+    INSERT INTO traders (
+        wallet_address, username, profile_image, x_username,
+        trader_score, category_scores, avg_position_size,
+        total_closed, win_rate, roi, last_updated
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(wallet_address) DO UPDATE SET
+        username=excluded.username,
+        profile_image=excluded.profile_image,
+        x_username=excluded.x_username,
+        trader_score=excluded.trader_score,
+        category_scores=excluded.category_scores,
+        avg_position_size=excluded.avg_position_size,
+        total_closed=excluded.total_closed,
+        win_rate=excluded.win_rate,
+        roi=excluded.roi,
+        last_updated=excluded.last_updated
+"""
+
+
+def _trader_row(trader: dict, updated_at: str) -> tuple:
+    return (
+        trader["wallet_address"],
+        trader.get("username"),
+        trader.get("profile_image"),
+        trader.get("x_username"),
+        trader.get("trader_score", 0),
+        json.dumps(trader.get("category_scores", {})),
+        trader.get("avg_position_size", 0),
+        trader.get("total_closed", 0),
+        trader.get("win_rate", 0),
+        trader.get("roi", 0),
+        updated_at,
+    )
+
+
 def upsert_trader(db_path: str, trader: dict) -> None:
     conn = _get_connection(db_path)
     try:
-        conn.execute(
-            """
-            INSERT INTO traders (
-                wallet_address, username, profile_image, x_username,
-                trader_score, category_scores, avg_position_size,
-                total_closed, win_rate, roi, last_updated
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(wallet_address) DO UPDATE SET
-                username=excluded.username,
-                profile_image=excluded.profile_image,
-                x_username=excluded.x_username,
-                trader_score=excluded.trader_score,
-                category_scores=excluded.category_scores,
-                avg_position_size=excluded.avg_position_size,
-                total_closed=excluded.total_closed,
-                win_rate=excluded.win_rate,
-                roi=excluded.roi,
-                last_updated=excluded.last_updated
-            """,
-            (
-                trader["wallet_address"],
-                trader.get("username"),
-                trader.get("profile_image"),
-                trader.get("x_username"),
-                trader.get("trader_score", 0),
-                json.dumps(trader.get("category_scores", {})),
-                trader.get("avg_position_size", 0),
-                trader.get("total_closed", 0),
-                trader.get("win_rate", 0),
-                trader.get("roi", 0),
-                datetime.utcnow().isoformat(),
-            ),
-        )
+        conn.execute(_UPSERT_TRADER_SQL, _trader_row(trader, datetime.utcnow().isoformat()))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def upsert_traders(db_path: str, traders: list[dict]) -> None:
+    """Upsert many traders in a single transaction."""
+    if not traders:
+        return
+    now = datetime.utcnow().isoformat()
+    conn = _get_connection(db_path)
+    try:
+        conn.executemany(_UPSERT_TRADER_SQL, [_trader_row(t, now) for t in traders])
         conn.commit()
     finally:
         conn.close()
@@ -367,6 +385,37 @@ def update_signal(db_path: str, signal_id: int, updates: dict) -> None:
         conn.close()
 
 
+def get_signal_directions(db_path: str, signal_ids: list[int]) -> dict[int, str]:
+    """Map signal id -> direction for the given ids; unknown ids are left out."""
+    if not signal_ids:
+        return {}
+    conn = _get_connection(db_path)
+    try:
+        placeholders = ", ".join("?" * len(signal_ids))
+        rows = conn.execute(
+            f"SELECT id, direction FROM signals WHERE id IN ({placeholders})",
+            list(signal_ids),
+        ).fetchall()
+        return {r["id"]: r["direction"] for r in rows}
+    finally:
+        conn.close()
+
+
+def update_signal_market_prices(db_path: str, prices: list[tuple[int, float]]) -> None:
+    """Set market_price_at_signal for many (signal_id, price) pairs in one transaction."""
+    if not prices:
+        return
+    conn = _get_connection(db_path)
+    try:
+        conn.executemany(
+            "UPDATE signals SET market_price_at_signal = ? WHERE id = ?",
+            [(price, sid) for sid, price in prices],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
 def get_active_signal(db_path: str, condition_id: str, direction: str, since_iso: str) -> dict | None:
     conn = _get_connection(db_path)
     try:
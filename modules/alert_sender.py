@@ -11,6 +11,7 @@ Two notification types:
   2. RESOLVED   — when a qualifying signal's market resolves (win/loss)
 """
 
+import functools
 import json
 import logging
 from datetime import datetime
@@ -45,9 +46,14 @@ def passes_strategy_filter(signal: dict) -> bool:
     return True
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime:
+    return datetime.fromisoformat(timestamp)
+
+
 def format_time_ago(timestamp: str) -> str:
     try:
-        dt = datetime.fromisoformat(timestamp)
+        dt = _parse_iso(timestamp)
     except (ValueError, TypeError):
         return "?"
     delta = datetime.utcnow() - dt
@@ -63,6 +69,13 @@ def format_time_ago(timestamp: str) -> str:
     return f"{days}d ago"
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_traders(raw: str) -> list[dict]:
+    # Stored payloads are often rendered more than once; decode each only once.
+    # Callers only read the result, so sharing the cached list is safe.
+    return json.loads(raw)
+
+
 def format_new_signal_message(signal: dict) -> str:
     """Format a new signal notification."""
     tier = signal.get("tier", 0)
@@ -77,7 +90,7 @@ def format_new_signal_message(signal: dict) -> str:
     involved_raw = signal.get("traders_involved", "[]")
     if isinstance(involved_raw, str):
         try:
-            involved = json.loads(involved_raw)
+            involved = _parse_traders(involved_raw)
         except (json.JSONDecodeError, TypeError):
             involved = []
     else:
@@ -97,6 +110,8 @@ def format_new_signal_message(signal: dict) -> str:
     lines.append("")
     lines.append(f"Traders ({len(involved)}):")
 
+    # Traders detected in the same scan share a timestamp; format each once
+    ago_by_ts: dict = {}
     for t in involved:
         username = t.get("username", "?")
         ts = t.get("trader_score", 0)
@@ -105,7 +120,9 @@ def format_new_signal_message(signal: dict) -> str:
         size = t.get("size", 0)
         conv = t.get("conviction", 0)
         detected = t.get("detected_at", "")
-        ago = format_time_ago(detected)
+        ago = ago_by_ts.get(detected)
+        if ago is None:
+            ago = ago_by_ts[detected] = format_time_ago(detected)
         lines.append(
             f"  - {username} (score {ts:.1f}, WR {wr:.0%})"
             f" \u2014 {ct} ${size:.0f} ({conv:.1f}x avg) {ago}"
@@ -1,14 +1,16 @@
 import asyncio
+import functools
+import heapq
 import logging
 import math
 import re
 import statistics
-from collections import defaultdict
+from dataclasses import dataclass, field
 
 import config
 from api.data_api import DataApiClient
 from api.gamma_api import GammaApiClient
-from db.models import upsert_trader
+from db.models import upsert_traders
 
 logger = logging.getLogger(__name__)
 
@@ -48,34 +50,42 @@ _CATEGORY_KEYWORDS = {
 }
 
 
+def _keyword_pattern(keywords: list[str]) -> re.Pattern:
+    # Short keywords (<=4 chars) must match as whole words, longer ones as substrings
+    parts = [
+        r'\b' + re.escape(kw) + r'\b' if len(kw) <= 4 else re.escape(kw)
+        for kw in keywords
+    ]
+    return re.compile("|".join(parts))
+
+
+# One compiled matcher per category, in priority order
+_CATEGORY_PATTERNS = [
+    (cat, _keyword_pattern(keywords)) for cat, keywords in _CATEGORY_KEYWORDS.items()
+]
+
+
 def classify_category(title: str) -> str | None:
     if not title:
         return None
-    lower = title.lower()
-    for cat, keywords in _CATEGORY_KEYWORDS.items():
-        for kw in keywords:
-            if len(kw) <= 4:
-                if re.search(r'\b' + re.escape(kw) + r'\b', lower):
-                    return cat
-            else:
-                if kw in lower:
-                    return cat
+    return _classify_lower(title.lower())
+
+
+@functools.lru_cache(maxsize=65536)
+def _classify_lower(lower: str) -> str | None:
+    """classify_category for a title that is already lowercased."""
+    for cat, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(lower):
+            return cat
     return None
 
 
 def calc_win_rate(closed_positions: list[dict]) -> float:
-    if not closed_positions:
-        return 0.0
-    wins = sum(1 for p in closed_positions if float(p.get("realizedPnl", 0)) > 0)
-    return wins / len(closed_positions)
+    return collect_closed_stats(closed_positions).win_rate
 
 
 def calc_roi(closed_positions: list[dict]) -> float:
-    total_pnl = sum(float(p.get("realizedPnl", 0)) for p in closed_positions)
-    total_bought = sum(float(p.get("totalBought", 0)) for p in closed_positions)
-    if total_bought == 0:
-        return 0.0
-    return total_pnl / total_bought
+    return collect_closed_stats(closed_positions).roi
 
 
 def calc_consistency(win_rate: float, total_closed: int) -> float:
@@ -85,53 +95,95 @@ def calc_consistency(win_rate: float, total_closed: int) -> float:
 
 
 def calc_timing_quality(closed_positions: list[dict]) -> float:
-    scores = []
-    for p in closed_positions:
-        pnl = float(p.get("realizedPnl", 0))
-        if pnl <= 0:
-            continue
-        avg_price = float(p.get("avgPrice", 0))
-        outcome = p.get("outcome", "").upper()
-        if outcome == "YES":
-            scores.append(1.0 - avg_price)
-        elif outcome == "NO":
-            scores.append(avg_price)
-    if not scores:
-        return 0.0
-    return statistics.mean(scores)
+    return collect_closed_stats(closed_positions).timing_quality
 
 
 def calc_volume_weight(closed_positions: list[dict]) -> float:
-    total_bought = sum(float(p.get("totalBought", 0)) for p in closed_positions)
-    if total_bought <= 1:
-        return 0.0
-    return math.log2(total_bought)
+    return collect_closed_stats(closed_positions).volume_weight
 
 
 def calc_avg_position_size(trades: list[dict]) -> float:
-    sizes = [float(t.get("usdcSize", 0)) for t in trades if float(t.get("usdcSize", 0)) > 0]
+    sizes = [s for t in trades if (s := float(t.get("usdcSize", 0) or 0)) > 0]
     if not sizes:
         return 0.0
     return statistics.median(sizes)
 
 
 def calc_category_scores(closed_positions: list[dict]) -> dict[str, float]:
-    by_cat: dict[str, list[dict]] = defaultdict(list)
+    return collect_closed_stats(closed_positions).category_scores()
+
+
+@dataclass(slots=True)
+class ClosedStats:
+    """Aggregates over a trader's closed positions, gathered in one pass."""
+
+    total: int = 0
+    wins: int = 0
+    total_pnl: float = 0.0
+    total_bought: float = 0.0
+    timing_sum: float = 0.0
+    timing_count: int = 0
+    # category -> [count, wins, pnl, bought]
+    by_cat: dict[str, list] = field(default_factory=dict)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.total if self.total else 0.0
+
+    @property
+    def roi(self) -> float:
+        return self.total_pnl / self.total_bought if self.total_bought else 0.0
+
+    @property
+    def timing_quality(self) -> float:
+        return self.timing_sum / self.timing_count if self.timing_count else 0.0
+
+    @property
+    def volume_weight(self) -> float:
+        return math.log2(self.total_bought) if self.total_bought > 1 else 0.0
+
+    def category_scores(self) -> dict[str, float]:
+        scores = {}
+        for cat, (count, wins, pnl, bought) in self.by_cat.items():
+            if count < 10:
+                continue
+            wr = wins / count
+            roi = pnl / bought if bought else 0.0
+            scores[cat] = round(calc_consistency(wr, count) * (1 + roi), 2)
+        return scores
+
+
+def collect_closed_stats(closed_positions: list[dict]) -> ClosedStats:
+    """Aggregate closed positions in one pass; the calc_* helpers read from this."""
+    stats = ClosedStats(total=len(closed_positions))
+    by_cat = stats.by_cat
     for p in closed_positions:
-        title = p.get("title", "") or p.get("eventTitle", "") or ""
-        cat = classify_category(title)
+        pnl = float(p.get("realizedPnl", 0))
+        bought = float(p.get("totalBought", 0))
+        won = pnl > 0
+        stats.total_pnl += pnl
+        stats.total_bought += bought
+        if won:
+            stats.wins += 1
+            outcome = p.get("outcome", "").upper()
+            if outcome == "YES":
+                stats.timing_sum += 1.0 - float(p.get("avgPrice", 0))
+                stats.timing_count += 1
+            elif outcome == "NO":
+                stats.timing_sum += float(p.get("avgPrice", 0))
+                stats.timing_count += 1
+
+        title = p.get("title") or p.get("eventTitle") or ""
+        cat = _classify_lower(title.lower()) if title else None
         if cat:
-            by_cat[cat].append(p)
-
-    scores = {}
-    for cat, positions in by_cat.items():
-        if len(positions) < 10:
-            continue
-        wr = calc_win_rate(positions)
-        roi = calc_roi(positions)
-        consistency = calc_consistency(wr, len(positions))
-        scores[cat] = round(consistency * (1 + roi), 2)
-    return scores
+            acc = by_cat.get(cat)
+            if acc is None:
+                acc = by_cat[cat] = [0, 0, 0.0, 0.0]
+            acc[0] += 1
+            acc[1] += won
+            acc[2] += pnl
+            acc[3] += bought
+    return stats
 
 
 class WatchlistBuilder:
@@ -179,22 +231,26 @@ class WatchlistBuilder:
                 t["consistency"] * t["roi_normalized"] * (1 + t["timing_quality"]) * (1 + t["volume_normalized"]),
                 4,
             )
-            upsert_trader(self.db_path, t)
+        upsert_traders(self.db_path, traders)
 
-        traders.sort(key=lambda t: t["trader_score"], reverse=True)
+        top5 = heapq.nlargest(5, traders, key=lambda t: t["trader_score"])
         logger.info(
             "Watchlist built: %d traders. Top 5: %s",
             len(traders),
-            [(t.get("username", t["wallet_address"][:8]), round(t["trader_score"], 2)) for t in traders[:5]],
+            [(t.get("username", t["wallet_address"][:8]), round(t["trader_score"], 2)) for t in top5],
         )
         return len(traders)
 
     async def _collect_wallets(self) -> dict[str, dict]:
         wallet_info: dict[str, dict] = {}
-        for cat in _CATEGORIES:
-            entries = await self.data_api.get_leaderboard_all(
+        leaderboards = await asyncio.gather(*[
+            self.data_api.get_leaderboard_all(
                 category=cat, time_period="ALL", order_by="PNL", max_results=200,
             )
+            for cat in _CATEGORIES
+        ])
+        # Fold in _CATEGORIES order so the first leaderboard a wallet appears on wins
+        for entries in leaderboards:
             for entry in entries:
                 addr = entry.get("proxyWallet") or entry.get("userAddress") or entry.get("address", "")
                 if addr and addr not in wallet_info:
@@ -209,16 +265,19 @@ class WatchlistBuilder:
         if len(closed) < config.MIN_CLOSED_POSITIONS:
             return None
 
-        profile = await self.gamma_api.get_public_profile(wallet)
-        trades = await self.data_api.get_trades(wallet, limit=500)
+        profile, trades = await asyncio.gather(
+            self.gamma_api.get_public_profile(wallet),
+            self.data_api.get_trades(wallet, limit=500),
+        )
 
-        win_rate = calc_win_rate(closed)
-        roi = calc_roi(closed)
+        stats = collect_closed_stats(closed)
+        win_rate = stats.win_rate
+        roi = stats.roi
         consistency = calc_consistency(win_rate, len(closed))
-        timing = calc_timing_quality(closed)
-        volume = calc_volume_weight(closed)
+        timing = stats.timing_quality
+        volume = stats.volume_weight
         avg_size = calc_avg_position_size(trades)
-        cat_scores = calc_category_scores(closed)
+        cat_scores = stats.category_scores()
 
         # Username: prefer profile, fallback to leaderboard data
         username = profile.get("username") or lb_data.get("username") or wallet[:10]
@@ -244,22 +303,22 @@ class WatchlistBuilder:
     def _normalize_roi(traders: list[dict]) -> None:
         rois = [t["roi"] for t in traders]
         min_roi = min(rois)
-        max_roi = max(rois)
-        spread = max_roi - min_roi
-        for t in traders:
-            if spread == 0:
+        spread = max(rois) - min_roi
+        if spread == 0:
+            for t in traders:
                 t["roi_normalized"] = 0.5
-            else:
-                t["roi_normalized"] = round((t["roi"] - min_roi) / spread, 4)
+            return
+        for t, roi in zip(traders, rois):
+            t["roi_normalized"] = round((roi - min_roi) / spread, 4)
 
     @staticmethod
     def _normalize_volume(traders: list[dict]) -> None:
         vols = [t["volume_weight"] for t in traders]
         min_vol = min(vols)
-        max_vol = max(vols)
-        spread = max_vol - min_vol
-        for t in traders:
-            if spread == 0:
+        spread = max(vols) - min_vol
+        if spread == 0:
+            for t in traders:
                 t["volume_normalized"] = 0.5
-            else:
-                t["volume_normalized"] = round((t["volume_weight"] - min_vol) / spread, 4)
+            return
+        for t, vol in zip(traders, vols):
+            t["volume_normalized"] = round((vol - min_vol) / spread, 4)
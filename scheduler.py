@@ -1,11 +1,19 @@
 import asyncio
+import json
 import logging
+import sqlite3
 from datetime import datetime, timedelta
 
 import config
 from api.data_api import DataApiClient
 from api.gamma_api import GammaApiClient
-from db.models import get_traders, delete_old_snapshots
+from db.models import (
+    get_traders,
+    delete_old_snapshots,
+    get_signal_directions,
+    update_signal_market_prices,
+    _get_connection,
+)
 from db.migrations import run_migrations
 from modules.watchlist_builder import WatchlistBuilder
 from modules.position_scanner import PositionScanner
@@ -27,6 +35,7 @@ class RadarScheduler:
         self.alert_sender = AlertSender(db_path=db_path)
         self.resolution_checker = ResolutionChecker(self.gamma_api, db_path)
         self._running = False
+        self._conn: sqlite3.Connection | None = None
 
         # Trading bot (optional — only active if BOT_ENABLED=true)
         self._bot_executor = None
@@ -123,84 +132,104 @@ class RadarScheduler:
         )
         return result
 
+    def _db(self) -> sqlite3.Connection:
+        """Connection reused by the scheduler's own queries across scan cycles."""
+        if self._conn is None:
+            self._conn = _get_connection(self.db_path)
+        return self._conn
+
     async def _enrich_market_prices(self, signals: list[dict]) -> None:
         """Fetch current market price for newly created signals via Gamma API."""
-        from db.models import _get_connection, update_signal
+        pending = [
+            (s["id"], s["condition_id"])
+            for s in signals
+            if s.get("new") and s.get("id") and s.get("condition_id")
+        ]
+        if not pending:
+            return
 
-        new_signals = [s for s in signals if s.get("new")]
-        if not new_signals:
+        try:
+            directions = get_signal_directions(self.db_path, [sid for sid, _ in pending])
+        except sqlite3.Error as e:
+            logger.warning("Failed to load signals for price enrichment: %s", e)
             return
+        pending = [(sid, cid) for sid, cid in pending if sid in directions]
+
+        # Gamma API has no rate limiter of its own; keep 5 requests in flight
+        sem = asyncio.Semaphore(5)
 
-        conn = _get_connection(self.db_path)
+        async def _fetch(condition_id: str) -> dict:
+            async with sem:
+                return await self.gamma_api.get_market_by_condition(condition_id)
+
+        markets = await asyncio.gather(
+            *[_fetch(cid) for _, cid in pending],
+            return_exceptions=True,
+        )
+
+        updates = []
+        for (sid, _), market in zip(pending, markets):
+            try:
+                if isinstance(market, Exception):
+                    raise market
+                market_price = self._market_price(market, directions[sid])
+            except Exception as e:
+                logger.warning("Failed to enrich signal %s: %s", sid, e)
+                continue
+            if market_price is not None:
+                updates.append((sid, market_price))
+
+        if not updates:
+            return
         try:
-            for sig in new_signals:
-                sid = sig.get("id")
-                cid = sig.get("condition_id")
-                if not sid or not cid:
-                    continue
-                try:
-                    # Fetch signal to get direction
-                    row = conn.execute(
-                        "SELECT direction FROM signals WHERE id = ?", (sid,)
-                    ).fetchone()
-                    if not row:
-                        continue
-                    direction = row["direction"]
-
-                    market = await self.gamma_api.get_market_by_condition(cid)
-                    if not market:
-                        continue
-
-                    # Parse outcomePrices — JSON string like "[0.35, 0.65]"
-                    outcome_prices = market.get("outcomePrices")
-                    if isinstance(outcome_prices, str):
-                        import json
-                        outcome_prices = json.loads(outcome_prices)
-
-                    if outcome_prices and len(outcome_prices) >= 2:
-                        # outcomePrices[0] = YES price, outcomePrices[1] = NO price
-                        if direction == "YES":
-                            market_price = float(outcome_prices[0])
-                        else:
-                            market_price = float(outcome_prices[1])
-                    else:
-                        continue
-
-                    update_signal(self.db_path, sid, {
-                        "market_price_at_signal": market_price,
-                    })
-                    logger.info(
-                        "Signal %d: market price at signal = %.4f",
-                        sid, market_price,
-                    )
-                except Exception as e:
-                    logger.warning("Failed to enrich signal %s: %s", sid, e)
-        finally:
-            conn.close()
+            update_signal_market_prices(self.db_path, updates)
+        except sqlite3.Error as e:
+            logger.warning("Failed to store market prices for %d signals: %s", len(updates), e)
+            return
+        for sid, market_price in updates:
+            logger.info(
+                "Signal %d: market price at signal = %.4f",
+                sid, market_price,
+            )
+
+    @staticmethod
+    def _market_price(market: dict, direction: str) -> float | None:
+        """Price of the signal's side from a Gamma market, or None if unavailable."""
+        if not market:
+            return None
+
+        # Parse outcomePrices — JSON string like "[0.35, 0.65]"
+        outcome_prices = market.get("outcomePrices")
+        if isinstance(outcome_prices, str):
+            outcome_prices = json.loads(outcome_prices)
+
+        if not outcome_prices or len(outcome_prices) < 2:
+            return None
+        # outcomePrices[0] = YES price, outcomePrices[1] = NO price
+        if direction == "YES":
+            return float(outcome_prices[0])
+        return float(outcome_prices[1])
 
     async def _maybe_send_daily_summary(self) -> None:
         """Send bot daily summary once per day."""
         if not self._bot_executor:
             return
-        from db.models import _get_connection
         from datetime import date
 
-        conn = _get_connection(self.db_path)
-        try:
-            row = conn.execute(
-                "SELECT value FROM bot_state WHERE key = 'last_daily_summary'"
-            ).fetchone()
-            last_date = row["value"] if row else ""
-            today = date.today().isoformat()
-            if last_date == today:
-                return
-        finally:
-            conn.close()
+        conn = self._db()
+        row = conn.execute(
+            "SELECT value FROM bot_state WHERE key = 'last_daily_summary'"
+        ).fetchone()
+        last_date = row["value"] if row else ""
+        today = date.today().isoformat()
+        if last_date == today:
+            return
 
         await self._bot_executor.send_daily_summary()
 
-        conn = _get_connection(self.db_path)
-        try:
+        # The connection outlives this call: commit, or roll back on error so
+        # no half-open transaction is left for later writers
+        with conn:
             conn.execute(
                 "INSERT INTO bot_state (key, value, updated_at) VALUES (?, ?, ?) "
                 "ON CONFLICT(key) DO UPDATE SET value=excluded.value, "
@@ -211,9 +240,6 @@ class RadarScheduler:
                     datetime.utcnow().isoformat(),
                 ),
             )
-            conn.commit()
-        finally:
-            conn.close()
 
     def _cleanup_old_data(self) -> None:
         cutoff = (
@@ -230,6 +256,9 @@ class RadarScheduler:
 
     async def close(self) -> None:
         self.stop()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
         await self.data_api.close()
         await self.gamma_api.close()
         logger.info("All API clients closed")
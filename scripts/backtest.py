@@ -7,6 +7,9 @@ Usage:
 """
 import argparse
 import asyncio
+import functools
+import heapq
+import io
 import json
 import logging
 import math
@@ -14,6 +17,7 @@ import os
 import sys
 from collections import defaultdict
 from datetime import datetime, timedelta
+from operator import itemgetter
 
 # Allow running from repo root
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,12 +26,7 @@ import config
 from api.data_api import DataApiClient
 from api.gamma_api import GammaApiClient
 from db.models import get_traders
-from modules.watchlist_builder import (
-    classify_category,
-    calc_win_rate,
-    calc_roi,
-    calc_avg_position_size,
-)
+from modules.watchlist_builder import classify_category
 from modules.signal_detector import calc_category_match, calc_signal_score
 
 logging.basicConfig(
@@ -41,29 +40,38 @@ logger = logging.getLogger("backtest")
 # ── Phase 1: Data collection ──────────────────────────────────────────
 
 
+# Pause per slot after each trader's fetch; see collect_trader_positions
+_POSITIONS_PACING = 0.2
+
+
 async def collect_trader_positions(
-    data_api: DataApiClient, traders: list[dict]
+    data_api: DataApiClient, traders: list[dict], concurrency: int = 2,
 ) -> dict[str, list[dict]]:
-    """Fetch closed positions in pairs to balance speed vs rate limits."""
+    """Fetch closed positions with bounded concurrency to respect API rate limits.
+
+    The Data API allows 150 requests per 10 s. Each slot holds its semaphore
+    for an extra _POSITIONS_PACING after a trader's fetch (on top of the
+    client's 0.1 s delay after every response), so the default 2 slots keep
+    the pace of the old "fetch 2, sleep 0.2 s" batch loop.
+    """
     all_positions: dict[str, list[dict]] = {}
     total = len(traders)
-    batch_size = 2  # 2 concurrent — safe for API rate limits
-
-    for start in range(0, total, batch_size):
-        batch = traders[start : start + batch_size]
-        tasks = [
-            data_api.get_closed_positions_all(t["wallet_address"], max_results=500)
-            for t in batch
-        ]
-        results = await asyncio.gather(*tasks)
-        for trader, positions in zip(batch, results):
-            if positions:
-                all_positions[trader["wallet_address"]] = positions
-
-        done = min(start + batch_size, total)
+    sem = asyncio.Semaphore(concurrency)
+    done = 0
+
+    async def _fetch(trader: dict) -> None:
+        nonlocal done
+        wallet = trader["wallet_address"]
+        async with sem:
+            positions = await data_api.get_closed_positions_all(wallet, max_results=500)
+            await asyncio.sleep(_POSITIONS_PACING)
+        if positions:
+            all_positions[wallet] = positions
+        done += 1
         if done % 50 == 0 or done == total:
             logger.info("Fetching positions %d/%d (%d with data)", done, total, len(all_positions))
-        await asyncio.sleep(0.2)
+
+    await asyncio.gather(*[_fetch(t) for t in traders])
 
     logger.info("Collected positions for %d/%d traders", len(all_positions), total)
     return all_positions
@@ -76,7 +84,7 @@ async def collect_resolved_markets(
     cutoff = (datetime.utcnow() - timedelta(days=months * 30)).strftime("%Y-%m-%d")
     logger.info("Fetching resolved markets since %s", cutoff)
     markets = await gamma_api.get_all_closed_markets(
-        end_date_min=cutoff, max_results=10000,
+        end_date_min=cutoff, max_results=10000, concurrency=5,
     )
     logger.info("Fetched %d resolved markets", len(markets))
     return markets
@@ -85,6 +93,12 @@ async def collect_resolved_markets(
 # ── Phase 2: Signal reconstruction ────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_json_list(raw: str) -> tuple:
+    """json.loads for the small, highly repetitive outcome/price strings."""
+    return tuple(json.loads(raw))
+
+
 def extract_resolution(market: dict) -> str | None:
     """Determine which outcome won from Gamma market data."""
     # outcomePrices is a JSON string like "[\"1\",\"0\"]" or "[\"0.95\",\"0.05\"]"
@@ -96,50 +110,62 @@ def extract_resolution(market: dict) -> str | None:
 
     if isinstance(prices_raw, str):
         try:
-            prices = json.loads(prices_raw)
+            prices = _parse_json_list(prices_raw)
         except (json.JSONDecodeError, TypeError):
             return None
     else:
         prices = prices_raw
 
-    if isinstance(outcomes_raw, str):
-        try:
-            outcomes = json.loads(outcomes_raw)
-        except (json.JSONDecodeError, TypeError):
-            outcomes = ["Yes", "No"]
-    else:
-        outcomes = outcomes_raw or ["Yes", "No"]
-
     # Find winning outcome (price >= 0.95)
     for idx, price in enumerate(prices):
         try:
             if float(price) >= 0.95:
-                if idx < len(outcomes):
-                    return str(outcomes[idx]).upper()
-                return "YES" if idx == 0 else "NO"
+                break
         except (ValueError, TypeError):
             continue
+    else:
+        return None
 
-    return None
+    # Only decode outcomes once a winner is known; most unresolved rows stop above
+    if isinstance(outcomes_raw, str):
+        try:
+            outcomes = _parse_json_list(outcomes_raw)
+        except (json.JSONDecodeError, TypeError):
+            outcomes = ["Yes", "No"]
+    else:
+        outcomes = outcomes_raw or ["Yes", "No"]
+
+    if idx < len(outcomes):
+        return str(outcomes[idx]).upper()
+    return "YES" if idx == 0 else "NO"
 
 
 def build_market_index(
     resolved_markets: list[dict],
+    relevant_cids: set[str] | None = None,
 ) -> dict[str, dict]:
-    """Index resolved markets by condition_id for fast lookup."""
+    """
+    Index resolved markets by condition_id for fast lookup.
+
+    If relevant_cids is given, markets outside it are skipped before their
+    resolution is parsed.
+    """
     index: dict[str, dict] = {}
     for m in resolved_markets:
         cid = m.get("condition_id") or m.get("conditionId", "")
         if not cid:
             continue
+        if relevant_cids is not None and cid not in relevant_cids:
+            continue
         resolution = extract_resolution(m)
         if not resolution:
             continue
+        title = m.get("question") or m.get("title", "")
         index[cid] = {
             "condition_id": cid,
-            "title": m.get("question") or m.get("title", ""),
+            "title": title,
             "slug": m.get("slug", ""),
-            "category": classify_category(m.get("question") or m.get("title", "")),
+            "category": classify_category(title),
             "resolution": resolution,
             "end_date": m.get("end_date_iso") or m.get("endDate", ""),
         }
@@ -179,20 +205,32 @@ def build_trader_market_map(
     return dict(market_traders)
 
 
+def top_wallets(traders_db: dict[str, dict], n: int = 10) -> frozenset[str]:
+    """Wallets of the n highest-scored traders."""
+    return frozenset(
+        w for w, _ in heapq.nlargest(n, traders_db.items(), key=lambda kv: kv[1].get("trader_score", 0))
+    )
+
+
 def reconstruct_signals(
     market_index: dict[str, dict],
     market_traders: dict[str, dict[str, dict]],
     traders_db: dict[str, dict],
+    top10_wallets: frozenset[str] | None = None,
 ) -> list[dict]:
     """
     For each resolved market, check if 2+ watchlist traders entered same direction.
     If yes, build a virtual signal and calculate score/tier.
+
+    top10_wallets can be passed in by callers that reconstruct repeatedly
+    against the same watchlist; otherwise it is derived from traders_db.
     """
-    top10_wallets = set(
-        sorted(traders_db.keys(), key=lambda w: traders_db[w].get("trader_score", 0), reverse=True)[:10]
-    )
+    if top10_wallets is None:
+        top10_wallets = top_wallets(traders_db)
 
     signals = []
+    # calc_category_match re-parses category_scores JSON; traders recur across markets
+    cat_match_cache: dict[tuple[str, str | None], float] = {}
 
     for cid, market_info in market_index.items():
         if cid not in market_traders:
@@ -201,23 +239,45 @@ def reconstruct_signals(
         participants = market_traders[cid]
 
         # Group by direction
-        by_direction: dict[str, list[dict]] = defaultdict(list)
+        # Keep (position, trader) pairs instead of merging them into a new dict per row
+        by_direction: dict[str, list[tuple[dict, dict]]] = defaultdict(list)
         for wallet, pos_data in participants.items():
-            if wallet not in traders_db:
+            trader = traders_db.get(wallet)
+            if trader is None:
                 continue
-            by_direction[pos_data["outcome"]].append({**pos_data, **traders_db[wallet]})
+            by_direction[pos_data["outcome"]].append((pos_data, trader))
 
         # Check each direction for convergence
         for direction, group in by_direction.items():
             if len(group) < 1:
                 continue
 
-            # Build trader data for scoring
+            # Build trader data for scoring, accumulating the per-signal sums as we go
             traders_data = []
-            for td in group:
-                wallet = td["wallet_address"]
+            total_bought_sum = 0.0
+            weighted_price_sum = 0.0
+            price_sum = 0.0
+            conviction_sum = 0.0
+            cat_match_count = 0
+            category = market_info.get("category")
+            for pos, td in group:
+                wallet = pos["wallet_address"]
+                avg_price = pos["avg_price"]
+                total_bought = pos["total_bought"]
                 avg_pos_size = td.get("avg_position_size", 0) or 1
-                conviction = td["total_bought"] / avg_pos_size if avg_pos_size > 0 else 1.0
+                conviction = total_bought / avg_pos_size if avg_pos_size > 0 else 1.0
+                conviction = min(conviction, 10.0)  # cap at 10x
+                key = (wallet, category)
+                category_match = cat_match_cache.get(key)
+                if category_match is None:
+                    category_match = cat_match_cache[key] = calc_category_match(td, category)
+
+                total_bought_sum += total_bought
+                weighted_price_sum += avg_price * total_bought
+                price_sum += avg_price
+                conviction_sum += conviction
+                if category_match > 1.0:
+                    cat_match_count += 1
 
                 traders_data.append({
                     "wallet_address": wallet,
@@ -225,11 +285,11 @@ def reconstruct_signals(
                     "trader_score": td.get("trader_score", 0),
                     "win_rate": td.get("win_rate", 0),
                     "roi": td.get("roi", 0),
-                    "conviction": min(conviction, 10.0),  # cap at 10x
-                    "category_match": calc_category_match(td, market_info.get("category")),
+                    "conviction": conviction,
+                    "category_match": category_match,
                     "freshness": 1.0,  # no timestamp data
-                    "avg_price": td.get("avg_price", 0),
-                    "total_bought": td.get("total_bought", 0),
+                    "avg_price": avg_price,
+                    "total_bought": total_bought,
                 })
 
             signal_score = calc_signal_score(traders_data)
@@ -241,13 +301,10 @@ def reconstruct_signals(
                 continue
 
             # Entry price = weighted average by position size
-            total_bought_sum = sum(t["total_bought"] for t in traders_data)
             if total_bought_sum > 0:
-                entry_price = sum(
-                    t["avg_price"] * t["total_bought"] for t in traders_data
-                ) / total_bought_sum
+                entry_price = weighted_price_sum / total_bought_sum
             else:
-                entry_price = sum(t["avg_price"] for t in traders_data) / len(traders_data)
+                entry_price = price_sum / num_traders
 
             # Resolution check
             resolution = market_info["resolution"]
@@ -262,9 +319,7 @@ def reconstruct_signals(
             else:
                 pnl = 0.0
 
-            # Category match ratio
-            cat_match_count = sum(1 for t in traders_data if t["category_match"] > 1.0)
-            avg_conviction = sum(t["conviction"] for t in traders_data) / len(traders_data)
+            avg_conviction = conviction_sum / num_traders
 
             signals.append({
                 "condition_id": cid,
@@ -292,7 +347,7 @@ def reconstruct_signals(
                 ],
             })
 
-    signals.sort(key=lambda s: s["end_date"], reverse=True)
+    signals.sort(key=itemgetter("end_date"), reverse=True)
     logger.info("Reconstructed %d virtual signals", len(signals))
     return signals
 
@@ -301,7 +356,7 @@ def _determine_tier(
     num_traders: int,
     signal_score: float,
     traders_data: list[dict],
-    top10_wallets: set[str],
+    top10_wallets: frozenset[str],
 ) -> int | None:
     if num_traders >= 3 and signal_score > config.HIGH_THRESHOLD:
         return 1
@@ -320,17 +375,19 @@ def _determine_tier(
 def compute_stats(signals: list[dict]) -> dict:
     """Compute win rates, P&L, Kelly criterion grouped by tier and category."""
 
-    def _tier_stats(sigs: list[dict]) -> dict:
-        if not sigs:
+    def _new_acc() -> list:
+        # [count, wins, pnl_sum, win_pnl_sum, entry_sum]
+        return [0, 0, 0.0, 0.0, 0.0]
+
+    def _tier_stats(acc: list) -> dict:
+        total, wins, pnl_sum, win_pnl_sum, entry_sum = acc
+        if not total:
             return {"count": 0}
-        wins = sum(1 for s in sigs if s["correct"])
-        total = len(sigs)
         win_rate = wins / total
-        avg_pnl = sum(s["pnl"] for s in sigs) / total
+        avg_pnl = pnl_sum / total
 
-        # Separate win and loss P&L for Kelly
-        win_pnls = [s["pnl"] for s in sigs if s["correct"]]
-        avg_win = sum(win_pnls) / len(win_pnls) if win_pnls else 0
+        # Average P&L of winning signals for Kelly
+        avg_win = win_pnl_sum / wins if wins else 0
 
         # Kelly fraction
         if avg_win > 0:
@@ -339,7 +396,7 @@ def compute_stats(signals: list[dict]) -> dict:
             kelly = 0
 
         # Average entry price
-        avg_entry = sum(s["entry_price"] for s in sigs) / total
+        avg_entry = entry_sum / total
 
         return {
             "count": total,
@@ -353,33 +410,35 @@ def compute_stats(signals: list[dict]) -> dict:
             "half_kelly": round(kelly / 2, 4),
         }
 
-    # By tier
-    by_tier = defaultdict(list)
-    for s in signals:
-        by_tier[s["tier"]].append(s)
-
-    tier_stats = {f"tier_{t}": _tier_stats(sigs) for t, sigs in sorted(by_tier.items())}
-
-    # By category
-    by_cat = defaultdict(list)
+    # One pass: every signal feeds overall, its tier, its category,
+    # its conviction bucket and its category-match bucket
+    overall = _new_acc()
+    by_tier = defaultdict(_new_acc)
+    by_cat = defaultdict(_new_acc)
+    high_conv, low_conv = _new_acc(), _new_acc()
+    with_cat, without_cat = _new_acc(), _new_acc()
     for s in signals:
-        cat = s.get("category") or "OTHER"
-        by_cat[cat].append(s)
-
-    cat_stats = {cat: _tier_stats(sigs) for cat, sigs in sorted(by_cat.items())}
-
-    # High conviction vs low conviction
-    high_conv = [s for s in signals if s["avg_conviction"] > 1.5]
-    low_conv = [s for s in signals if s["avg_conviction"] <= 1.5]
-
-    # With category match vs without
-    with_cat = [s for s in signals if s["cat_match_ratio"] > 0.5]
-    without_cat = [s for s in signals if s["cat_match_ratio"] <= 0.5]
+        pnl = s["pnl"]
+        entry = s["entry_price"]
+        correct = s["correct"]
+        for acc in (
+            overall,
+            by_tier[s["tier"]],
+            by_cat[s.get("category") or "OTHER"],
+            high_conv if s["avg_conviction"] > 1.5 else low_conv,
+            with_cat if s["cat_match_ratio"] > 0.5 else without_cat,
+        ):
+            acc[0] += 1
+            acc[2] += pnl
+            acc[4] += entry
+            if correct:
+                acc[1] += 1
+                acc[3] += pnl
 
     return {
-        "overall": _tier_stats(signals),
-        "by_tier": tier_stats,
-        "by_category": cat_stats,
+        "overall": _tier_stats(overall),
+        "by_tier": {f"tier_{t}": _tier_stats(acc) for t, acc in sorted(by_tier.items())},
+        "by_category": {cat: _tier_stats(acc) for cat, acc in sorted(by_cat.items())},
         "high_conviction": _tier_stats(high_conv),
         "low_conviction": _tier_stats(low_conv),
         "with_category_match": _tier_stats(with_cat),
@@ -388,75 +447,85 @@ def compute_stats(signals: list[dict]) -> dict:
 
 
 def print_report(stats: dict, signals: list[dict]) -> None:
-    """Print a human-readable report to stdout."""
-    print("\n" + "=" * 70)
-    print("  BACKTEST REPORT — Polymarket Convergence Signals")
-    print("=" * 70)
+    """Print a human-readable report to stdout in a single write."""
+    buf = io.StringIO()
+    print("\n" + "=" * 70, file=buf)
+    print("  BACKTEST REPORT — Polymarket Convergence Signals", file=buf)
+    print("=" * 70, file=buf)
 
     overall = stats["overall"]
-    print(f"\n  Total signals: {overall['count']}")
-    print(f"  Win rate:      {overall.get('win_rate', 0) * 100:.1f}%")
-    print(f"  Avg P&L:       {overall.get('avg_pnl', 0) * 100:+.1f}%")
-    print(f"  Kelly:         {overall.get('kelly', 0):.4f}")
-    print(f"  Half-Kelly:    {overall.get('half_kelly', 0):.4f}")
-
-    print("\n" + "-" * 70)
-    print("  BY TIER")
-    print("-" * 70)
-    print(f"  {'Tier':<8} {'Count':>6} {'Wins':>6} {'WR':>8} {'Avg P&L':>10} {'Kelly':>8}")
+    print(f"\n  Total signals: {overall['count']}", file=buf)
+    print(f"  Win rate:      {overall.get('win_rate', 0) * 100:.1f}%", file=buf)
+    print(f"  Avg P&L:       {overall.get('avg_pnl', 0) * 100:+.1f}%", file=buf)
+    print(f"  Kelly:         {overall.get('kelly', 0):.4f}", file=buf)
+    print(f"  Half-Kelly:    {overall.get('half_kelly', 0):.4f}", file=buf)
+
+    print("\n" + "-" * 70, file=buf)
+    print("  BY TIER", file=buf)
+    print("-" * 70, file=buf)
+    print(f"  {'Tier':<8} {'Count':>6} {'Wins':>6} {'WR':>8} {'Avg P&L':>10} {'Kelly':>8}", file=buf)
     for tier_name, ts in sorted(stats["by_tier"].items()):
         if ts["count"] == 0:
             continue
         print(
             f"  {tier_name:<8} {ts['count']:>6} {ts.get('wins', 0):>6} "
             f"{ts.get('win_rate', 0) * 100:>7.1f}% {ts.get('avg_pnl', 0) * 100:>+9.1f}% "
-            f"{ts.get('kelly', 0):>8.4f}"
+            f"{ts.get('kelly', 0):>8.4f}",
+            file=buf,
         )
 
-    print("\n" + "-" * 70)
-    print("  BY CATEGORY")
-    print("-" * 70)
-    print(f"  {'Category':<12} {'Count':>6} {'WR':>8} {'Avg P&L':>10}")
+    print("\n" + "-" * 70, file=buf)
+    print("  BY CATEGORY", file=buf)
+    print("-" * 70, file=buf)
+    print(f"  {'Category':<12} {'Count':>6} {'WR':>8} {'Avg P&L':>10}", file=buf)
     for cat, cs in sorted(stats["by_category"].items(), key=lambda x: x[1].get("count", 0), reverse=True):
         if cs["count"] == 0:
             continue
         print(
             f"  {cat:<12} {cs['count']:>6} {cs.get('win_rate', 0) * 100:>7.1f}% "
-            f"{cs.get('avg_pnl', 0) * 100:>+9.1f}%"
+            f"{cs.get('avg_pnl', 0) * 100:>+9.1f}%",
+            file=buf,
         )
 
-    print("\n" + "-" * 70)
-    print("  CONVICTION & CATEGORY MATCH ANALYSIS")
-    print("-" * 70)
+    print("\n" + "-" * 70, file=buf)
+    print("  CONVICTION & CATEGORY MATCH ANALYSIS", file=buf)
+    print("-" * 70, file=buf)
     hc = stats["high_conviction"]
     lc = stats["low_conviction"]
     wc = stats["with_category_match"]
     nc = stats["without_category_match"]
-    print(f"  High conviction (>1.5x):  {hc.get('count', 0):>4} signals, WR {hc.get('win_rate', 0) * 100:.1f}%, P&L {hc.get('avg_pnl', 0) * 100:+.1f}%")
-    print(f"  Low conviction  (≤1.5x):  {lc.get('count', 0):>4} signals, WR {lc.get('win_rate', 0) * 100:.1f}%, P&L {lc.get('avg_pnl', 0) * 100:+.1f}%")
-    print(f"  With cat match  (>50%):   {wc.get('count', 0):>4} signals, WR {wc.get('win_rate', 0) * 100:.1f}%, P&L {wc.get('avg_pnl', 0) * 100:+.1f}%")
-    print(f"  Without cat match (≤50%): {nc.get('count', 0):>4} signals, WR {nc.get('win_rate', 0) * 100:.1f}%, P&L {nc.get('avg_pnl', 0) * 100:+.1f}%")
+    print(f"  High conviction (>1.5x):  {hc.get('count', 0):>4} signals, WR {hc.get('win_rate', 0) * 100:.1f}%, P&L {hc.get('avg_pnl', 0) * 100:+.1f}%", file=buf)
+    print(f"  Low conviction  (≤1.5x):  {lc.get('count', 0):>4} signals, WR {lc.get('win_rate', 0) * 100:.1f}%, P&L {lc.get('avg_pnl', 0) * 100:+.1f}%", file=buf)
+    print(f"  With cat match  (>50%):   {wc.get('count', 0):>4} signals, WR {wc.get('win_rate', 0) * 100:.1f}%, P&L {wc.get('avg_pnl', 0) * 100:+.1f}%", file=buf)
+    print(f"  Without cat match (≤50%): {nc.get('count', 0):>4} signals, WR {nc.get('win_rate', 0) * 100:.1f}%, P&L {nc.get('avg_pnl', 0) * 100:+.1f}%", file=buf)
 
     # Top 5 best and worst signals
-    sorted_by_pnl = sorted(signals, key=lambda s: s["pnl"], reverse=True)
-    print("\n" + "-" * 70)
-    print("  TOP 5 BEST SIGNALS")
-    print("-" * 70)
+    sorted_by_pnl = sorted(signals, key=itemgetter("pnl"), reverse=True)
+    print("\n" + "-" * 70, file=buf)
+    print("  TOP 5 BEST SIGNALS", file=buf)
+    print("-" * 70, file=buf)
     for s in sorted_by_pnl[:5]:
-        print(f"  T{s['tier']} | {s['direction']} @ {s['entry_price']:.2f} → {s['resolution']} | P&L {s['pnl'] * 100:+.0f}% | {s['market_title'][:50]}")
+        print(f"  T{s['tier']} | {s['direction']} @ {s['entry_price']:.2f} → {s['resolution']} | P&L {s['pnl'] * 100:+.0f}% | {s['market_title'][:50]}", file=buf)
 
-    print("\n  TOP 5 WORST SIGNALS")
-    print("-" * 70)
+    print("\n  TOP 5 WORST SIGNALS", file=buf)
+    print("-" * 70, file=buf)
     for s in sorted_by_pnl[-5:]:
-        print(f"  T{s['tier']} | {s['direction']} @ {s['entry_price']:.2f} → {s['resolution']} | P&L {s['pnl'] * 100:+.0f}% | {s['market_title'][:50]}")
+        print(f"  T{s['tier']} | {s['direction']} @ {s['entry_price']:.2f} → {s['resolution']} | P&L {s['pnl'] * 100:+.0f}% | {s['market_title'][:50]}", file=buf)
 
-    print("\n" + "=" * 70)
+    print("\n" + "=" * 70, file=buf)
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 # ── Main ──────────────────────────────────────────────────────────────
 
 
-async def run_backtest(months: int, output_path: str | None, limit_traders: int = 0) -> dict:
+async def run_backtest(
+    months: int,
+    output_path: str | None,
+    limit_traders: int = 0,
+    concurrency: int = 2,
+) -> dict:
     data_api = DataApiClient()
     gamma_api = GammaApiClient()
 
@@ -470,19 +539,24 @@ async def run_backtest(months: int, output_path: str | None, limit_traders: int
 
         # All traders for DB lookup, but limit API fetching
         traders_db = {t["wallet_address"]: t for t in traders}
+        top10_wallets = top_wallets(traders_db)
         if limit_traders > 0:
             traders = traders[:limit_traders]
 
         logger.info("Watchlist: %d traders (fetching %d)", len(traders_db), len(traders))
 
-        all_positions = await collect_trader_positions(data_api, traders)
-        resolved_markets = await collect_resolved_markets(gamma_api, months)
+        # Positions (Data API) and markets (Gamma API) are independent; fetch both at once
+        all_positions, resolved_markets = await asyncio.gather(
+            collect_trader_positions(data_api, traders, concurrency),
+            collect_resolved_markets(gamma_api, months),
+        )
 
         # Phase 2: Reconstruct signals
         logger.info("=== Phase 2: Reconstructing signals ===")
-        market_index = build_market_index(resolved_markets)
+        # Only markets a watchlist trader took part in can produce a signal
         market_traders = build_trader_market_map(all_positions)
-        signals = reconstruct_signals(market_index, market_traders, traders_db)
+        market_index = build_market_index(resolved_markets, set(market_traders))
+        signals = reconstruct_signals(market_index, market_traders, traders_db, top10_wallets)
 
         if not signals:
             logger.warning("No signals reconstructed! Check if traders have overlapping markets.")
@@ -502,7 +576,9 @@ async def run_backtest(months: int, output_path: str | None, limit_traders: int
                 "run_at": datetime.utcnow().isoformat(),
                 "traders_count": len(traders),
                 "positions_count": sum(len(v) for v in all_positions.values()),
-                "markets_count": len(market_index),
+                # Resolved markets some fetched position refers to; others are
+                # no longer parsed, so the full resolved count isn't known
+                "relevant_markets_count": len(market_index),
                 "signals_count": len(signals),
             },
             "stats": stats,
@@ -526,9 +602,12 @@ def main():
     parser.add_argument("--months", type=int, default=3, help="How many months back (default: 3)")
     parser.add_argument("--output", "-o", type=str, default=None, help="Save results to JSON file")
     parser.add_argument("--limit-traders", type=int, default=0, help="Limit number of traders (0=all, for testing)")
+    parser.add_argument("--concurrency", type=int, default=2, help="Concurrent position fetches (default: 2; the Data API allows 150 requests/10s)")
     args = parser.parse_args()
 
-    results = asyncio.run(run_backtest(args.months, args.output, args.limit_traders))
+    results = asyncio.run(
+        run_backtest(args.months, args.output, args.limit_traders, args.concurrency)
+    )
 
     if results and results.get("stats", {}).get("overall", {}).get("count", 0) > 0:
         overall = results["stats"]["overall"]
@@ -31,7 +31,11 @@ def main():
     print(f"Run at: {meta.get('run_at', '?')}")
     print(f"Traders: {meta.get('traders_count', '?')}")
     print(f"Positions analyzed: {meta.get('positions_count', '?')}")
-    print(f"Markets with resolution: {meta.get('markets_count', '?')}")
+    if "relevant_markets_count" in meta:
+        print(f"Resolved markets with watchlist positions: {meta['relevant_markets_count']}")
+    else:
+        # Results written before the index was limited to traded markets
+        print(f"Markets with resolution: {meta.get('markets_count', '?')}")
     print(f"Signals reconstructed: {meta.get('signals_count', '?')}")
 
     stats = results.get("stats", {})
@@ -8,15 +8,17 @@ Two pools:
 Usage:
     python scripts/portfolio_sim.py full_results.json
 """
+import functools
 import json
 import math
 import sys
 import os
-from collections import defaultdict
+from collections import Counter
 from datetime import datetime
 
 INITIAL_BALANCE = 100.0
 MAX_BET_FRACTION = 0.25  # max 25% of portfolio per trade
+SIGNAL_DEFAULTS = {"entry_price": 0, "tier": 99, "correct": False, "pnl": 0, "end_date": ""}
 
 # ── Price & category filters ────────────────────────────────────────
 
@@ -25,37 +27,63 @@ MAX_ENTRY_PRICE = 0.85        # above this → skip (tiny upside)
 BAD_CATEGORIES = {"CRYPTO", "CULTURE", "FINANCE"}  # negative avg P&L in backtest
 
 
+def prepare_signals(signals: list[dict]) -> list[dict]:
+    """Fill defaults, normalize category and day, and sort by end_date, in place.
+
+    Callers then index fields directly instead of .get() with fallbacks.
+    """
+    for s in signals:
+        for key, default in SIGNAL_DEFAULTS.items():
+            s.setdefault(key, default)
+        s["_cat"] = (s.get("category") or "OTHER").upper()
+        s["_date10"] = s["end_date"][:10]
+    signals.sort(key=lambda s: s["end_date"])
+    return signals
+
+
 def is_main_signal(s: dict) -> bool:
     """Signal qualifies for main portfolio."""
-    price = s.get("entry_price", 0)
-    cat = (s.get("category") or "OTHER").upper()
+    price = s["entry_price"]
     return (
         PENNY_THRESHOLD <= price <= MAX_ENTRY_PRICE
-        and cat not in BAD_CATEGORIES
+        and s["_cat"] not in BAD_CATEGORIES
     )
 
 
 def is_gambling_signal(s: dict) -> bool:
     """Signal qualifies for gambling pool (penny bets)."""
-    price = s.get("entry_price", 0)
+    price = s["entry_price"]
     return 0 < price < PENNY_THRESHOLD
 
 
+def split_pools(signals: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Partition signals into (main, gambling) pools in a single pass."""
+    main: list[dict] = []
+    gambling: list[dict] = []
+    for s in signals:
+        if is_main_signal(s):
+            main.append(s)
+        elif is_gambling_signal(s):
+            gambling.append(s)
+    return main, gambling
+
+
 # ── Strategies ──────────────────────────────────────────────────────
+# Filters run on signals already in their pool (see split_pools).
 
 MAIN_STRATEGIES = {
     "Main: Tier 1 Only": {
-        "filter": lambda s: is_main_signal(s) and s["tier"] == 1,
+        "filter": lambda s: s["tier"] == 1,
         "description": "Tier 1, entry $0.10-$0.85, excl. CRYPTO/CULTURE/FINANCE",
     },
     "Main: Tier 1+2": {
-        "filter": lambda s: is_main_signal(s) and s["tier"] <= 2,
+        "filter": lambda s: s["tier"] <= 2,
         "description": "Tier 1+2, entry $0.10-$0.85, excl. CRYPTO/CULTURE/FINANCE",
     },
     "Main: Tier 1+2 Sports+Politics+Tech": {
         "filter": lambda s: (
-            is_main_signal(s) and s["tier"] <= 2
-            and (s.get("category") or "OTHER").upper() in ("SPORTS", "POLITICS", "TECH", "OTHER", "WEATHER")
+            s["tier"] <= 2
+            and s["_cat"] in ("SPORTS", "POLITICS", "TECH", "OTHER", "WEATHER")
         ),
         "description": "Tier 1+2, only profitable categories",
     },
@@ -63,11 +91,11 @@ MAIN_STRATEGIES = {
 
 GAMBLING_STRATEGIES = {
     "Gambling: Tier 1 Penny": {
-        "filter": lambda s: is_gambling_signal(s) and s["tier"] == 1,
+        "filter": lambda s: s["tier"] == 1,
         "description": "Tier 1 penny bets (entry < $0.10) — lottery tickets",
     },
     "Gambling: Tier 1+2 Penny": {
-        "filter": lambda s: is_gambling_signal(s) and s["tier"] <= 2,
+        "filter": lambda s: s["tier"] <= 2,
         "description": "Tier 1+2 penny bets (entry < $0.10) — lottery tickets",
     },
 }
@@ -103,49 +131,59 @@ def simulate(signals: list[dict], strategy_filter, kelly_by_tier: dict,
              initial_balance: float = INITIAL_BALANCE,
              flat_bet: float | None = None) -> dict:
     """
-    Simulate a portfolio following a strategy on sorted signals.
+    Simulate a portfolio following a strategy on signals sorted by end_date.
 
     flat_bet: if set, bet this fixed dollar amount per trade (no compounding).
               if None, use Kelly-based fraction of current portfolio (compounding).
+
+    equity_curve is columnar: parallel "dates" and "balances" lists (index 0
+    is the starting balance) plus "events", one raw (correct, tier,
+    entry_price, bet_size, profit) tuple per trade for format_event.
     """
-    sorted_signals = sorted(
-        [s for s in signals if strategy_filter(s)],
-        key=lambda s: s.get("end_date", ""),
-    )
+    sorted_signals = [s for s in signals if strategy_filter(s)]
 
     if not sorted_signals:
         return {
             "trades": 0, "wins": 0, "losses": 0,
             "final_balance": initial_balance, "roi": 0,
-            "max_drawdown": 0, "equity_curve": [],
+            "max_drawdown": 0,
+            "equity_curve": {"dates": [], "balances": [], "events": []},
         }
 
     portfolio = initial_balance
     peak = initial_balance
     max_drawdown = 0
-    equity_curve = [{"date": "start", "balance": portfolio, "event": "initial"}]
+    dates = ["start"]
+    balances = [portfolio]
+    events = []
     wins = 0
     losses = 0
 
-    for signal in sorted_signals:
-        tier = signal["tier"]
-        entry_price = signal["entry_price"]
+    # Kelly fraction per tier with the per-trade caps applied up front:
+    # min(p * k, p * MAX_BET_FRACTION, p) == p * min(k, MAX_BET_FRACTION, 1) for p > 0
+    bet_fraction = {t: min(k, MAX_BET_FRACTION, 1.0) for t, k in kelly_by_tier.items()}
+    default_fraction = min(0.03, MAX_BET_FRACTION, 1.0)
 
+    # Unpack the fields the loop needs once, instead of per-iteration dict lookups
+    rows = [
+        (s["tier"], s["entry_price"], s["correct"], s["_date10"])
+        for s in sorted_signals
+    ]
+
+    for tier, entry_price, correct, date_str in rows:
         if entry_price <= 0 or entry_price >= 1 or portfolio <= 0.01:
             continue
 
         if flat_bet is not None:
             bet_size = min(flat_bet, portfolio)
         else:
-            kelly = kelly_by_tier.get(tier, 0.03)
-            bet_size = portfolio * kelly
-            bet_size = min(bet_size, portfolio * MAX_BET_FRACTION, portfolio)
+            bet_size = portfolio * bet_fraction.get(tier, default_fraction)
 
         bet_size = max(bet_size, 0)
         if bet_size < 0.01:
             continue
 
-        if signal["correct"]:
+        if correct:
             shares = bet_size / entry_price
             payout = shares * 1.0
             profit = payout - bet_size
@@ -156,20 +194,17 @@ def simulate(signals: list[dict], strategy_filter, kelly_by_tier: dict,
 
         portfolio += profit
 
+        # A new high cannot be a drawdown, so only measure when below the peak
         if portfolio > peak:
             peak = portfolio
-        drawdown = (peak - portfolio) / peak if peak > 0 else 0
-        if drawdown > max_drawdown:
-            max_drawdown = drawdown
-
-        date_str = signal.get("end_date", "")[:10]
-        equity_curve.append({
-            "date": date_str,
-            "balance": round(portfolio, 2),
-            "event": f"{'WIN' if signal['correct'] else 'LOSS'} T{tier} "
-                     f"@{entry_price:.2f} bet=${bet_size:.1f} → "
-                     f"{'$' + str(round(profit, 1)) if profit >= 0 else '-$' + str(round(-profit, 1))}",
-        })
+        elif peak > 0:
+            drawdown = (peak - portfolio) / peak
+            if drawdown > max_drawdown:
+                max_drawdown = drawdown
+
+        dates.append(date_str)
+        balances.append(round(portfolio, 2))
+        events.append((correct, tier, entry_price, bet_size, profit))
 
     total = wins + losses
     return {
@@ -180,30 +215,47 @@ def simulate(signals: list[dict], strategy_filter, kelly_by_tier: dict,
         "final_balance": round(portfolio, 2),
         "roi": round((portfolio - initial_balance) / initial_balance * 100, 1),
         "max_drawdown": round(max_drawdown * 100, 1),
-        "equity_curve": equity_curve,
+        "equity_curve": {"dates": dates, "balances": balances, "events": events},
     }
 
 
+def format_event(event: tuple) -> str:
+    """Human-readable description of one simulate() trade."""
+    correct, tier, entry_price, bet_size, profit = event
+    return (
+        f"{'WIN' if correct else 'LOSS'} T{tier} "
+        f"@{entry_price:.2f} bet=${bet_size:.1f} → "
+        f"{'$' + str(round(profit, 1)) if profit >= 0 else '-$' + str(round(-profit, 1))}"
+    )
+
+
 # ── Weekly equity chart ─────────────────────────────────────────────
 
 
-def render_equity_chart(equity_curve: list[dict], width: int = 50,
+@functools.lru_cache(maxsize=4096)
+def _week_label(date: str) -> str | None:
+    """ISO date → "YYYY-Www" label; cached since many trades share a day."""
+    try:
+        return datetime.fromisoformat(date).strftime("%Y-W%W")
+    except (ValueError, TypeError):
+        return None
+
+
+def render_equity_chart(equity_curve: dict, width: int = 50,
                         initial: float = INITIAL_BALANCE) -> str:
     """Render a simple text-based equity chart grouped by week."""
-    if len(equity_curve) < 2:
+    dates = equity_curve["dates"]
+    if len(dates) < 2:
         return "  (not enough data)"
 
     weekly: dict[str, float] = {}
-    for point in equity_curve:
-        date = point["date"]
+    for date, balance in zip(dates, equity_curve["balances"]):
         if date == "start":
             continue
-        try:
-            dt = datetime.fromisoformat(date)
-            week = dt.strftime("%Y-W%W")
-        except (ValueError, TypeError):
+        week = _week_label(date)
+        if week is None:
             continue
-        weekly[week] = point["balance"]
+        weekly[week] = balance
 
     if not weekly:
         return "  (no dated entries)"
@@ -227,19 +279,15 @@ def render_equity_chart(equity_curve: list[dict], width: int = 50,
 # ── Signal stats ────────────────────────────────────────────────────
 
 
-def print_pool_stats(signals: list[dict], pool_filter, label: str):
+def print_pool_stats(pool: list[dict], label: str):
     """Print quick stats about a signal pool."""
-    pool = [s for s in signals if pool_filter(s)]
     if not pool:
         print(f"  {label}: 0 signals")
         return
     wins = sum(1 for s in pool if s["correct"])
     wr = wins / len(pool) * 100
     avg_price = sum(s["entry_price"] for s in pool) / len(pool)
-    cats = defaultdict(int)
-    for s in pool:
-        cats[s.get("category") or "OTHER"] += 1
-    top_cats = sorted(cats.items(), key=lambda x: -x[1])[:5]
+    top_cats = Counter(s.get("category") or "OTHER" for s in pool).most_common(5)
     cat_str = ", ".join(f"{c}({n})" for c, n in top_cats)
     print(f"  {label}: {len(pool)} signals, WR {wr:.1f}%, avg entry ${avg_price:.2f}")
     print(f"    Categories: {cat_str}")
@@ -257,9 +305,11 @@ def run_simulation(results_path: str) -> None:
         print("No signals in results file.")
         sys.exit(1)
 
-    # Pre-filter signal pools for Kelly calculation
-    main_signals = [s for s in signals if is_main_signal(s)]
-    gambling_signals = [s for s in signals if is_gambling_signal(s)]
+    # Pools and strategy filters keep prepare_signals' order, so simulate needn't re-sort
+    prepare_signals(signals)
+
+    # Split into pools once; Kelly, pool stats and strategies all work per pool
+    main_signals, gambling_signals = split_pools(signals)
 
     # Kelly: Quarter-Kelly for main, Half-Kelly for gambling
     main_kelly = {}
@@ -279,10 +329,10 @@ def run_simulation(results_path: str) -> None:
     print(f"  Total signals: {len(signals)}")
     print(f"  Filters: entry ${PENNY_THRESHOLD}–${MAX_ENTRY_PRICE}, excl {BAD_CATEGORIES}")
     print()
-    print_pool_stats(signals, is_main_signal, "Main pool")
+    print_pool_stats(main_signals, "Main pool")
     print(f"    Kelly (Quarter): T1={main_kelly[1]:.3f}, T2={main_kelly[2]:.3f}")
     print()
-    print_pool_stats(signals, is_gambling_signal, "Gambling pool")
+    print_pool_stats(gambling_signals, "Gambling pool")
     print(f"    Kelly (Half):    T1={gambling_kelly[1]:.3f}, T2={gambling_kelly[2]:.3f}")
 
     # Flat bet sizes: $5 per main trade, $2 per gambling trade
@@ -296,7 +346,7 @@ def run_simulation(results_path: str) -> None:
 
     main_results = {}
     for name, strategy in MAIN_STRATEGIES.items():
-        result = simulate(signals, strategy["filter"], main_kelly, flat_bet=MAIN_FLAT_BET)
+        result = simulate(main_signals, strategy["filter"], main_kelly, flat_bet=MAIN_FLAT_BET)
         main_results[name] = result
 
     print(f"\n  {'Strategy':<38} {'Trades':>6} {'W/L':>8} {'WR':>6} {'Final $':>9} {'ROI':>8} {'MaxDD':>6}")
@@ -320,26 +370,30 @@ def run_simulation(results_path: str) -> None:
     print(f"  GAMBLING POOL — $100, flat ${GAMBLING_FLAT_BET:.0f}/trade (lottery tickets)")
     print(f"{'=' * 70}")
 
+    # No penny signals → every gambling strategy would trade nothing; skip them
     gambling_results = {}
-    for name, strategy in GAMBLING_STRATEGIES.items():
-        result = simulate(signals, strategy["filter"], gambling_kelly, flat_bet=GAMBLING_FLAT_BET)
-        gambling_results[name] = result
-
-    print(f"\n  {'Strategy':<38} {'Trades':>6} {'W/L':>8} {'WR':>6} {'Final $':>9} {'ROI':>8} {'MaxDD':>6}")
-    for name, r in gambling_results.items():
-        wl = f"{r['wins']}/{r['losses']}"
-        print(
-            f"  {name:<38} {r['trades']:>6} {wl:>8} "
-            f"{r['win_rate'] * 100:>5.1f}% ${r['final_balance']:>7.0f} "
-            f"{r['roi']:>+7.1f}% {r['max_drawdown']:>5.1f}%"
-        )
-
-    for name, r in gambling_results.items():
-        print(f"\n{'─' * 70}")
-        print(f"  {name} — {GAMBLING_STRATEGIES[name]['description']}")
-        print(f"  $100 → ${r['final_balance']:.0f} ({r['roi']:+.1f}%) | MaxDD: {r['max_drawdown']:.1f}%")
-        print(f"{'─' * 70}")
-        print(render_equity_chart(r["equity_curve"]))
+    if not gambling_signals:
+        print("\n  No penny signals — gambling strategies skipped.")
+    else:
+        for name, strategy in GAMBLING_STRATEGIES.items():
+            result = simulate(gambling_signals, strategy["filter"], gambling_kelly, flat_bet=GAMBLING_FLAT_BET)
+            gambling_results[name] = result
+
+        print(f"\n  {'Strategy':<38} {'Trades':>6} {'W/L':>8} {'WR':>6} {'Final $':>9} {'ROI':>8} {'MaxDD':>6}")
+        for name, r in gambling_results.items():
+            wl = f"{r['wins']}/{r['losses']}"
+            print(
+                f"  {name:<38} {r['trades']:>6} {wl:>8} "
+                f"{r['win_rate'] * 100:>5.1f}% ${r['final_balance']:>7.0f} "
+                f"{r['roi']:>+7.1f}% {r['max_drawdown']:>5.1f}%"
+            )
+
+        for name, r in gambling_results.items():
+            print(f"\n{'─' * 70}")
+            print(f"  {name} — {GAMBLING_STRATEGIES[name]['description']}")
+            print(f"  $100 → ${r['final_balance']:.0f} ({r['roi']:+.1f}%) | MaxDD: {r['max_drawdown']:.1f}%")
+            print(f"{'─' * 70}")
+            print(render_equity_chart(r["equity_curve"]))
 
     # ── Combined summary ──
     print(f"\n{'=' * 70}")
@@ -347,15 +401,20 @@ def run_simulation(results_path: str) -> None:
     print(f"{'=' * 70}")
 
     best_main_name = max(main_results, key=lambda n: main_results[n]["roi"])
-    best_gambling_name = max(gambling_results, key=lambda n: gambling_results[n]["roi"])
     best_main = main_results[best_main_name]
-    best_gambling = gambling_results[best_gambling_name]
+    if gambling_results:
+        best_gambling_name = max(gambling_results, key=lambda n: gambling_results[n]["roi"])
+        best_gambling = gambling_results[best_gambling_name]
+    else:
+        # Gambling $100 stays uninvested
+        best_gambling_name = None
+        best_gambling = {"final_balance": INITIAL_BALANCE, "roi": 0.0}
     combined = best_main["final_balance"] + best_gambling["final_balance"]
     combined_roi = (combined - 200) / 200 * 100
 
     print(f"\n  Best main:     {best_main_name}")
     print(f"    $100 → ${best_main['final_balance']:.0f} ({best_main['roi']:+.1f}%)")
-    print(f"  Best gambling: {best_gambling_name}")
+    print(f"  Best gambling: {best_gambling_name or 'none (no penny signals)'}")
     print(f"    $100 → ${best_gambling['final_balance']:.0f} ({best_gambling['roi']:+.1f}%)")
     print(f"\n  Combined: $200 → ${combined:.0f} ({combined_roi:+.1f}%)")
 
@@ -363,9 +422,10 @@ def run_simulation(results_path: str) -> None:
     print(f"\n{'─' * 70}")
     print(f"  TRADE LOG (last 50): {best_main_name}")
     print(f"{'─' * 70}")
-    trade_entries = [p for p in best_main["equity_curve"] if p["event"] != "initial"]
-    for point in trade_entries[-50:]:
-        print(f"  {point['date']} | ${point['balance']:>8.0f} | {point['event']}")
+    best_curve = best_main["equity_curve"]
+    trade_rows = list(zip(best_curve["dates"][1:], best_curve["balances"][1:], best_curve["events"]))
+    for date, balance, event in trade_rows[-50:]:
+        print(f"  {date} | ${balance:>8.0f} | {format_event(event)}")
 
     print("\n" + "=" * 70)
 
@@ -8,24 +8,45 @@ Splits signals by date into two halves:
 Usage:
     python scripts/train_test_split.py full_results.json
 """
+import bisect
 import json
+import math
 import sys
 import os
 from collections import defaultdict
 from datetime import datetime
 
+from portfolio_sim import prepare_signals
+
 
 def load_signals(path: str) -> list[dict]:
     with open(path) as f:
         data = json.load(f)
-    return data.get("signals", [])
+    # Splitting and filtering preserve prepare_signals' chronological order
+    return prepare_signals(data.get("signals", []))
 
 
 def split_by_date(signals: list[dict], ratio: float = 0.5) -> tuple[list, list]:
-    """Split signals chronologically."""
-    sorted_sigs = sorted(signals, key=lambda s: s.get("end_date", ""))
-    split_idx = int(len(sorted_sigs) * ratio)
-    return sorted_sigs[:split_idx], sorted_sigs[split_idx:]
+    """Split signals chronologically. Expects them sorted by end_date (see load_signals)."""
+    split_idx = int(len(signals) * ratio)
+    return signals[:split_idx], signals[split_idx:]
+
+
+PRICE_RANGES = [
+    "penny (<0.10)",
+    "low (0.10-0.30)",
+    "mid (0.30-0.60)",
+    "high (0.60-0.85)",
+    "very high (>0.85)",
+]
+_PRICE_EDGES = [0.10, 0.30, 0.60]  # left-closed lower edges of low/mid/high
+
+
+def _price_range(price: float) -> str:
+    """Name of the PRICE_RANGES bucket a price falls into (0.85 itself is "high")."""
+    if price > 0.85:
+        return PRICE_RANGES[-1]
+    return PRICE_RANGES[bisect.bisect_right(_PRICE_EDGES, price)]
 
 
 def analyze_pool(signals: list[dict], label: str) -> dict:
@@ -33,53 +54,51 @@ def analyze_pool(signals: list[dict], label: str) -> dict:
     if not signals:
         return {"count": 0}
 
-    dates = [s.get("end_date", "")[:10] for s in signals if s.get("end_date")]
-    date_range = f"{min(dates)} → {max(dates)}" if dates else "?"
-
+    # One pass: [count, wins, pnl_sum] per tier, category and price range
+    by_tier = defaultdict(lambda: [0, 0, 0])
+    by_cat = defaultdict(lambda: [0, 0, 0])
+    by_price = defaultdict(lambda: [0, 0, 0])
+    wins = 0
+    first_date = last_date = None
+    for s in signals:
+        correct = 1 if s["correct"] else 0
+        pnl = s["pnl"]
+        wins += correct
+        for acc in (by_tier[s["tier"]], by_cat[s["_cat"]], by_price[_price_range(s["entry_price"])]):
+            acc[0] += 1
+            acc[1] += correct
+            acc[2] += pnl
+        date = s["_date10"]
+        if date:
+            if first_date is None or date < first_date:
+                first_date = date
+            if last_date is None or date > last_date:
+                last_date = date
+
+    date_range = f"{first_date} → {last_date}" if first_date else "?"
     total = len(signals)
-    wins = sum(1 for s in signals if s.get("correct"))
     wr = wins / total if total > 0 else 0
 
     # By tier
     tiers = {}
     for tier in (1, 2, 3):
-        t_sigs = [s for s in signals if s.get("tier") == tier]
-        if not t_sigs:
+        if tier not in by_tier:
             continue
-        t_wins = sum(1 for s in t_sigs if s.get("correct"))
-        t_wr = t_wins / len(t_sigs)
-        t_avg_pnl = sum(s.get("pnl", 0) for s in t_sigs) / len(t_sigs)
-        tiers[tier] = {"count": len(t_sigs), "wins": t_wins, "wr": t_wr, "avg_pnl": t_avg_pnl}
+        count, t_wins, pnl_sum = by_tier[tier]
+        tiers[tier] = {"count": count, "wins": t_wins, "wr": t_wins / count, "avg_pnl": pnl_sum / count}
 
     # By category
     cats = {}
-    cat_groups = defaultdict(list)
-    for s in signals:
-        cat = (s.get("category") or "OTHER").upper()
-        cat_groups[cat].append(s)
-    for cat, sigs in sorted(cat_groups.items(), key=lambda x: -len(x[1])):
-        c_wins = sum(1 for s in sigs if s.get("correct"))
-        c_wr = c_wins / len(sigs)
-        c_pnl = sum(s.get("pnl", 0) for s in sigs) / len(sigs)
-        cats[cat] = {"count": len(sigs), "wr": c_wr, "avg_pnl": c_pnl}
+    for cat, (count, c_wins, pnl_sum) in sorted(by_cat.items(), key=lambda x: -x[1][0]):
+        cats[cat] = {"count": count, "wr": c_wins / count, "avg_pnl": pnl_sum / count}
 
     # By price range
-    price_ranges = {
-        "penny (<0.10)": lambda s: s.get("entry_price", 0) < 0.10,
-        "low (0.10-0.30)": lambda s: 0.10 <= s.get("entry_price", 0) < 0.30,
-        "mid (0.30-0.60)": lambda s: 0.30 <= s.get("entry_price", 0) < 0.60,
-        "high (0.60-0.85)": lambda s: 0.60 <= s.get("entry_price", 0) <= 0.85,
-        "very high (>0.85)": lambda s: s.get("entry_price", 0) > 0.85,
-    }
     prices = {}
-    for name, filt in price_ranges.items():
-        p_sigs = [s for s in signals if filt(s)]
-        if not p_sigs:
+    for name in PRICE_RANGES:
+        if name not in by_price:
             continue
-        p_wins = sum(1 for s in p_sigs if s.get("correct"))
-        p_wr = p_wins / len(p_sigs)
-        p_pnl = sum(s.get("pnl", 0) for s in p_sigs) / len(p_sigs)
-        prices[name] = {"count": len(p_sigs), "wr": p_wr, "avg_pnl": p_pnl}
+        count, p_wins, pnl_sum = by_price[name]
+        prices[name] = {"count": count, "wr": p_wins / count, "avg_pnl": pnl_sum / count}
 
     return {
         "label": label,
@@ -103,9 +122,9 @@ def apply_filters(signals: list[dict],
         bad_cats = set()
     return [
         s for s in signals
-        if s.get("tier", 99) <= max_tier
-        and min_price <= s.get("entry_price", 0) <= max_price
-        and (s.get("category") or "OTHER").upper() not in bad_cats
+        if s["tier"] <= max_tier
+        and min_price <= s["entry_price"] <= max_price
+        and s["_cat"] not in bad_cats
     ]
 
 
@@ -129,15 +148,15 @@ def print_stats(stats: dict):
 
 
 def simulate_flat(signals: list[dict], bet: float = 5.0, initial: float = 100.0) -> dict:
-    """Quick flat-bet simulation."""
+    """Quick flat-bet simulation over signals sorted by end_date."""
     portfolio = initial
     wins = losses = 0
-    for s in sorted(signals, key=lambda x: x.get("end_date", "")):
-        ep = s.get("entry_price", 0)
+    for s in signals:
+        ep = s["entry_price"]
         if ep <= 0 or ep >= 1 or portfolio <= 0.01:
             continue
         b = min(bet, portfolio)
-        if s.get("correct"):
+        if s["correct"]:
             profit = (b / ep) - b
             wins += 1
         else:
@@ -153,6 +172,12 @@ def simulate_flat(signals: list[dict], bet: float = 5.0, initial: float = 100.0)
     }
 
 
+def binomial_p_value(k: int, n: int) -> float:
+    """Exact one-sided p-value P(X >= k) for X ~ Binomial(n, 0.5)."""
+    tail = sum(math.comb(n, i) for i in range(k, n + 1))
+    return tail / 2 ** n
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python scripts/train_test_split.py <results.json>")
@@ -235,8 +260,8 @@ def main():
             train_filtered = apply_filters(train, **filter_kwargs)
             test_filtered = apply_filters(test, **filter_kwargs)
         else:
-            train_filtered = [s for s in train if s.get("tier", 99) <= 3]
-            test_filtered = [s for s in test if s.get("tier", 99) <= 3]
+            train_filtered = [s for s in train if s["tier"] <= 3]
+            test_filtered = [s for s in test if s["tier"] <= 3]
 
         train_sim = simulate_flat(train_filtered)
         test_sim = simulate_flat(test_filtered)
@@ -259,23 +284,19 @@ def main():
     # Binomial test on test set with backtest v2 filters
     test_v2 = apply_filters(test, min_price=0.10, max_price=0.85,
                             bad_cats=backtest_bad_cats, max_tier=2)
-    test_v2_sorted = sorted(test_v2, key=lambda x: x.get("end_date", ""))
-    n = len(test_v2_sorted)
-    k = sum(1 for s in test_v2_sorted if s.get("correct"))
+    n = len(test_v2)
+    k = sum(1 for s in test_v2 if s["correct"])
 
     if n > 0:
         wr = k / n
-        # Normal approximation for binomial test
-        import math
         se = math.sqrt(0.5 * 0.5 / n)  # SE under H0: p=0.5
         z = (wr - 0.5) / se
-        # One-sided p-value approximation
-        p_value = 0.5 * math.erfc(z / math.sqrt(2))
+        p_value = binomial_p_value(k, n)
 
         print(f"\n  Test set (backtest v2 filters): {n} signals, {k} wins, WR={wr:.1%}")
         print(f"  H0: WR = 50% (coin flip)")
         print(f"  Z-score: {z:.2f}")
-        print(f"  p-value (one-sided): {p_value:.6f}")
+        print(f"  p-value (one-sided, exact binomial): {p_value:.6f}")
         if p_value < 0.05:
             print(f"  → STATISTICALLY SIGNIFICANT at 5% level")
         elif p_value < 0.10:
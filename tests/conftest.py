@@ -1,15 +1,33 @@
-import os
-import tempfile
+import sqlite3
+import uuid
 
 import pytest
 
 from db.migrations import run_migrations
 
 
-@pytest.fixture
-def db_path():
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
+@pytest.fixture(scope="session")
+def _migrated_db():
+    # Shared-cache in-memory database: every connection opened on this URI
+    # sees the same data, with no file or journal on disk. The pinned
+    # connection keeps it alive between the short-lived ones tests open.
+    path = f"file:testdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    pin = sqlite3.connect(path, uri=True)
     run_migrations(path)
+    yield path, pin
+    pin.close()
+
+
+@pytest.fixture
+def db_path(_migrated_db):
+    """Migrated test database, emptied again after each test."""
+    path, pin = _migrated_db
     yield path
-    os.unlink(path)
+    tables = [
+        row[0]
+        for row in pin.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    ]
+    # Clearing sqlite_sequence restarts AUTOINCREMENT ids at 1
+    with pin:
+        for table in tables:
+            pin.execute(f"DELETE FROM {table}")
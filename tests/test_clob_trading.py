@@ -1,6 +1,7 @@
 """Tests for bot/clob_trading.py — CLOB API wrapper with mocked py-clob-client."""
 
 import sys
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -17,73 +18,81 @@ def mock_clob_client():
         yield client
 
 
+@pytest.fixture(scope="module")
+def clob_modules():
+    """Stand-ins for the py_clob_client modules imported inside place_market_order.
+
+    Built once per module: tests only configure mock_clob_client, never these.
+    """
+    # Only attribute access and a plain constructor call are needed here
+    return {
+        "py_clob_client": SimpleNamespace(),
+        "py_clob_client.clob_types": SimpleNamespace(
+            MarketOrderArgs=SimpleNamespace, OrderType=SimpleNamespace(FOK="FOK")
+        ),
+        "py_clob_client.order_builder": SimpleNamespace(),
+        "py_clob_client.order_builder.constants": SimpleNamespace(BUY="BUY"),
+    }
+
+
+@pytest.fixture
+def clob_stubs(monkeypatch, clob_modules):
+    """Install clob_modules into sys.modules for the duration of a test."""
+    for name, module in clob_modules.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    return clob_modules
+
+
+@pytest.fixture(scope="module")
+def base_market():
+    """Two-outcome market payload as returned by ClobClient.get_market."""
+    return {
+        "tokens": [
+            {"token_id": "tok_yes", "outcome": "Yes"},
+            {"token_id": "tok_no", "outcome": "No"},
+        ],
+        "accepting_orders": True,
+        "minimum_order_size": 1,
+        "minimum_tick_size": 0.01,
+        "neg_risk": False,
+    }
+
+
+@pytest.fixture
+def trading(mock_clob_client):
+    """ClobTradingClient whose underlying ClobClient is mock_clob_client."""
+    return ClobTradingClient("0xfake")
+
+
 @pytest.mark.asyncio
 class TestResolveTokenId:
-    async def test_yes_direction(self, mock_clob_client):
-        mock_clob_client.get_market.return_value = {
-            "tokens": [
-                {"token_id": "tok_yes", "outcome": "Yes"},
-                {"token_id": "tok_no", "outcome": "No"},
-            ],
-            "accepting_orders": True,
-            "minimum_order_size": 1,
-            "minimum_tick_size": 0.01,
-            "neg_risk": False,
-        }
-        trading = ClobTradingClient("0xfake")
+    async def test_yes_direction(self, mock_clob_client, trading, base_market):
+        mock_clob_client.get_market.return_value = base_market
         result = await trading.resolve_token_id("cond_123", "YES")
         assert result is not None
         assert result.token_id == "tok_yes"
         assert result.outcome == "YES"
         assert result.accepting_orders is True
 
-    async def test_no_direction(self, mock_clob_client):
-        mock_clob_client.get_market.return_value = {
-            "tokens": [
-                {"token_id": "tok_yes", "outcome": "Yes"},
-                {"token_id": "tok_no", "outcome": "No"},
-            ],
-            "accepting_orders": True,
-            "minimum_order_size": 1,
-            "minimum_tick_size": 0.01,
-            "neg_risk": False,
-        }
-        trading = ClobTradingClient("0xfake")
+    async def test_no_direction(self, mock_clob_client, trading, base_market):
+        mock_clob_client.get_market.return_value = base_market
         result = await trading.resolve_token_id("cond_123", "NO")
         assert result is not None
         assert result.token_id == "tok_no"
         assert result.outcome == "NO"
 
-    async def test_market_not_found(self, mock_clob_client):
+    async def test_market_not_found(self, mock_clob_client, trading):
         mock_clob_client.get_market.return_value = None
-        trading = ClobTradingClient("0xfake")
         result = await trading.resolve_token_id("cond_missing", "YES")
         assert result is None
 
-    async def test_token_not_found(self, mock_clob_client):
-        mock_clob_client.get_market.return_value = {
-            "tokens": [],
-            "accepting_orders": True,
-            "minimum_order_size": 1,
-            "minimum_tick_size": 0.01,
-            "neg_risk": False,
-        }
-        trading = ClobTradingClient("0xfake")
+    async def test_token_not_found(self, mock_clob_client, trading, base_market):
+        mock_clob_client.get_market.return_value = {**base_market, "tokens": []}
         result = await trading.resolve_token_id("cond_123", "YES")
         assert result is None
 
-    async def test_neg_risk_market(self, mock_clob_client):
-        mock_clob_client.get_market.return_value = {
-            "tokens": [
-                {"token_id": "tok_yes", "outcome": "Yes"},
-                {"token_id": "tok_no", "outcome": "No"},
-            ],
-            "accepting_orders": True,
-            "minimum_order_size": 1,
-            "minimum_tick_size": 0.01,
-            "neg_risk": True,
-        }
-        trading = ClobTradingClient("0xfake")
+    async def test_neg_risk_market(self, mock_clob_client, trading, base_market):
+        mock_clob_client.get_market.return_value = {**base_market, "neg_risk": True}
         result = await trading.resolve_token_id("cond_123", "YES")
         assert result is not None
         assert result.neg_risk is True
@@ -91,102 +100,58 @@ class TestResolveTokenId:
 
 @pytest.mark.asyncio
 class TestGetCurrentPrice:
-    async def test_returns_midpoint(self, mock_clob_client):
+    async def test_returns_midpoint(self, mock_clob_client, trading):
         mock_clob_client.get_midpoint.return_value = {"mid": "0.55"}
-        trading = ClobTradingClient("0xfake")
         price = await trading.get_current_price("tok_123")
         assert price == 0.55
 
-    async def test_no_midpoint(self, mock_clob_client):
+    async def test_no_midpoint(self, mock_clob_client, trading):
         mock_clob_client.get_midpoint.return_value = {}
-        trading = ClobTradingClient("0xfake")
         price = await trading.get_current_price("tok_123")
         assert price is None
 
 
 @pytest.mark.asyncio
 class TestGetBalance:
-    async def test_returns_balance_in_dollars(self, mock_clob_client):
+    async def test_returns_balance_in_dollars(self, mock_clob_client, trading):
         mock_clob_client.get_balance_allowance.return_value = {
             "balance": "10000000"  # 10 USDC (6 decimals)
         }
-        trading = ClobTradingClient("0xfake")
         balance = await trading.get_balance()
         assert balance == 10.0
 
-    async def test_empty_balance(self, mock_clob_client):
+    async def test_empty_balance(self, mock_clob_client, trading):
         mock_clob_client.get_balance_allowance.return_value = {}
-        trading = ClobTradingClient("0xfake")
         balance = await trading.get_balance()
         assert balance == 0.0
 
 
 @pytest.mark.asyncio
 class TestPlaceMarketOrder:
-    async def test_success(self, mock_clob_client):
-        # Mock the py_clob_client imports used inside _place()
-        mock_order_type = MagicMock()
-        mock_order_type.FOK = "FOK"
-        mock_market_args = MagicMock()
-
-        with patch.dict("sys.modules", {
-            "py_clob_client": MagicMock(),
-            "py_clob_client.clob_types": MagicMock(
-                MarketOrderArgs=mock_market_args, OrderType=mock_order_type
-            ),
-            "py_clob_client.order_builder": MagicMock(),
-            "py_clob_client.order_builder.constants": MagicMock(BUY="BUY"),
-        }):
-            mock_clob_client.create_market_order.return_value = MagicMock()
-            mock_clob_client.post_order.return_value = {
-                "orderID": "ord_abc",
-                "averagePrice": 0.50,
-                "size": 1.0,
-                "success": True,
-            }
-            trading = ClobTradingClient("0xfake")
-            result = await trading.place_market_order("tok_123", 0.50)
-            assert result.success is True
-            assert result.order_id == "ord_abc"
-            assert result.cost_usd == 0.50
-
-    async def test_failure(self, mock_clob_client):
-        mock_order_type = MagicMock()
-        mock_order_type.FOK = "FOK"
-        mock_market_args = MagicMock()
-
-        with patch.dict("sys.modules", {
-            "py_clob_client": MagicMock(),
-            "py_clob_client.clob_types": MagicMock(
-                MarketOrderArgs=mock_market_args, OrderType=mock_order_type
-            ),
-            "py_clob_client.order_builder": MagicMock(),
-            "py_clob_client.order_builder.constants": MagicMock(BUY="BUY"),
-        }):
-            mock_clob_client.create_market_order.return_value = MagicMock()
-            mock_clob_client.post_order.return_value = {
-                "errorMsg": "Insufficient funds",
-            }
-            trading = ClobTradingClient("0xfake")
-            result = await trading.place_market_order("tok_123", 0.50)
-            assert result.success is False
-            assert "Insufficient funds" in result.error_message
-
-    async def test_exception(self, mock_clob_client):
-        mock_order_type = MagicMock()
-        mock_order_type.FOK = "FOK"
-        mock_market_args = MagicMock()
-
-        with patch.dict("sys.modules", {
-            "py_clob_client": MagicMock(),
-            "py_clob_client.clob_types": MagicMock(
-                MarketOrderArgs=mock_market_args, OrderType=mock_order_type
-            ),
-            "py_clob_client.order_builder": MagicMock(),
-            "py_clob_client.order_builder.constants": MagicMock(BUY="BUY"),
-        }):
-            mock_clob_client.create_market_order.side_effect = Exception("Network error")
-            trading = ClobTradingClient("0xfake")
-            result = await trading.place_market_order("tok_123", 0.50)
-            assert result.success is False
-            assert "Network error" in result.error_message
+    async def test_success(self, mock_clob_client, trading, clob_stubs):
+        mock_clob_client.create_market_order.return_value = MagicMock()
+        mock_clob_client.post_order.return_value = {
+            "orderID": "ord_abc",
+            "averagePrice": 0.50,
+            "size": 1.0,
+            "success": True,
+        }
+        result = await trading.place_market_order("tok_123", 0.50)
+        assert result.success is True
+        assert result.order_id == "ord_abc"
+        assert result.cost_usd == 0.50
+
+    async def test_failure(self, mock_clob_client, trading, clob_stubs):
+        mock_clob_client.create_market_order.return_value = MagicMock()
+        mock_clob_client.post_order.return_value = {
+            "errorMsg": "Insufficient funds",
+        }
+        result = await trading.place_market_order("tok_123", 0.50)
+        assert result.success is False
+        assert "Insufficient funds" in result.error_message
+
+    async def test_exception(self, mock_clob_client, trading, clob_stubs):
+        mock_clob_client.create_market_order.side_effect = Exception("Network error")
+        result = await trading.place_market_order("tok_123", 0.50)
+        assert result.success is False
+        assert "Network error" in result.error_message
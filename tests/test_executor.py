@@ -3,7 +3,6 @@
 import json
 import sqlite3
 from datetime import datetime
-from unittest.mock import AsyncMock, patch, MagicMock
 
 import pytest
 
@@ -12,6 +11,9 @@ from db.models import init_db, _get_connection, insert_signal, mark_signal_sent,
 from bot.executor import BotExecutor
 from bot.clob_trading import MarketInfo, OrderResult
 
+# Tests only need a recent timestamp, not a unique one per row
+_NOW = datetime.utcnow().isoformat()
+
 
 def _seed_signal(db_path, sent=True, **overrides):
     """Insert a test signal and return its ID."""
@@ -27,8 +29,8 @@ def _seed_signal(db_path, sent=True, **overrides):
         "traders_involved": [],
         "current_price": 0.50,
         "market_category": "POLITICS",
-        "created_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat(),
+        "created_at": _NOW,
+        "updated_at": _NOW,
         "sent": False,
     }
     base.update(overrides)
@@ -38,6 +40,38 @@ def _seed_signal(db_path, sent=True, **overrides):
     return sid
 
 
+def _seed_trade(db_path, signal_id, resolution=None, **columns):
+    """Insert a bot_trades row for a signal, optionally resolving the signal.
+
+    Both writes share one transaction.
+    """
+    row = {
+        "signal_id": signal_id,
+        "condition_id": "c_test",
+        "direction": "YES",
+        "status": "OPEN",
+        "created_at": _NOW,
+        "updated_at": _NOW,
+    }
+    row.update(columns)
+    conn = _get_connection(db_path)
+    try:
+        with conn:
+            conn.execute(
+                f"INSERT INTO bot_trades ({', '.join(row)}) "
+                f"VALUES ({', '.join('?' * len(row))})",
+                tuple(row.values()),
+            )
+            if resolution is not None:
+                conn.execute(
+                    "UPDATE signals SET resolved_at = ?, resolution_outcome = ? "
+                    "WHERE id = ?",
+                    (_NOW, resolution, signal_id),
+                )
+    finally:
+        conn.close()
+
+
 def _get_bot_trades(db_path):
     """Get all bot_trades rows."""
     conn = _get_connection(db_path)
@@ -62,60 +96,42 @@ def _make_market_info(**overrides):
     return MarketInfo(**base)
 
 
-class TestGetTradeableSignals:
-    def test_returns_sent_active_untraded(self, db_path):
-        _seed_signal(db_path, sent=True)
-        executor = BotExecutor(db_path)
-        signals = executor._get_tradeable_signals()
-        assert len(signals) == 1
+class _StubClob:
+    """Async stand-in for ClobTradingClient returning canned values."""
 
-    def test_excludes_unsent(self, db_path):
-        _seed_signal(db_path, sent=False)
-        executor = BotExecutor(db_path)
-        signals = executor._get_tradeable_signals()
-        assert len(signals) == 0
+    def __init__(self, market_info=None, price=None, balance=0.0, order_result=None):
+        self.market_info = market_info
+        self.price = price
+        self.balance = balance
+        self.order_result = order_result
 
-    def test_excludes_already_traded(self, db_path):
-        sid = _seed_signal(db_path, sent=True)
-        # Insert a bot_trade for this signal
-        conn = _get_connection(db_path)
-        try:
-            conn.execute(
-                "INSERT INTO bot_trades (signal_id, condition_id, direction, "
-                "status, created_at, updated_at) "
-                "VALUES (?, 'c_test', 'YES', 'OPEN', ?, ?)",
-                (sid, datetime.utcnow().isoformat(), datetime.utcnow().isoformat()),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+    async def resolve_token_id(self, condition_id, direction):
+        return self.market_info
 
-        executor = BotExecutor(db_path)
-        signals = executor._get_tradeable_signals()
-        assert len(signals) == 0
+    async def get_current_price(self, token_id):
+        return self.price
 
-    def test_excludes_resolved(self, db_path):
-        _seed_signal(db_path, sent=True)
-        # Mark signal as resolved
-        conn = _get_connection(db_path)
-        try:
-            conn.execute(
-                "UPDATE signals SET resolved_at = ? WHERE condition_id = 'c_test'",
-                (datetime.utcnow().isoformat(),),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+    async def get_balance(self):
+        return self.balance
+
+    async def place_market_order(self, token_id, amount_usd):
+        return self.order_result
 
-        executor = BotExecutor(db_path)
-        signals = executor._get_tradeable_signals()
-        assert len(signals) == 0
 
-    def test_excludes_bad_categories(self, db_path):
-        _seed_signal(db_path, sent=True, market_category="CRYPTO")
+class TestGetTradeableSignals:
+    def test_selects_only_eligible_signals(self, db_path):
+        # One pool with a signal per exclusion rule; each condition_id names its case
+        _seed_signal(db_path, sent=True, condition_id="c_eligible")
+        _seed_signal(db_path, sent=False, condition_id="c_unsent")
+        traded = _seed_signal(db_path, sent=True, condition_id="c_traded")
+        _seed_trade(db_path, traded, condition_id="c_traded")
+        resolved = _seed_signal(db_path, sent=True, condition_id="c_resolved")
+        update_signal(db_path, resolved, {"resolved_at": _NOW})
+        _seed_signal(db_path, sent=True, condition_id="c_bad_category", market_category="CRYPTO")
+
         executor = BotExecutor(db_path)
         signals = executor._get_tradeable_signals()
-        assert len(signals) == 0
+        assert {s["condition_id"] for s in signals} == {"c_eligible"}
 
 
 @pytest.mark.asyncio
@@ -124,12 +140,13 @@ class TestExecuteTrade:
         sid = _seed_signal(db_path, sent=True)
         executor = BotExecutor(db_path)
         executor._initialized = True
-        executor._clob = AsyncMock()
-        executor._clob.resolve_token_id.return_value = _make_market_info()
-        executor._clob.get_current_price.return_value = 0.50
-        executor._clob.get_balance.return_value = 8.0
-        executor._clob.place_market_order.return_value = OrderResult(
-            success=True, order_id="ord_abc", cost_usd=0.50, shares_filled=1.0,
+        executor._clob = _StubClob(
+            market_info=_make_market_info(),
+            price=0.50,
+            balance=8.0,
+            order_result=OrderResult(
+                success=True, order_id="ord_abc", cost_usd=0.50, shares_filled=1.0,
+            ),
         )
 
         signal = executor._get_tradeable_signals()[0]
@@ -145,9 +162,8 @@ class TestExecuteTrade:
         _seed_signal(db_path, sent=True)
         executor = BotExecutor(db_path)
         executor._initialized = True
-        executor._clob = AsyncMock()
-        executor._clob.resolve_token_id.return_value = _make_market_info(
-            accepting_orders=False
+        executor._clob = _StubClob(
+            market_info=_make_market_info(accepting_orders=False)
         )
 
         signal = executor._get_tradeable_signals()[0]
@@ -159,9 +175,8 @@ class TestExecuteTrade:
         _seed_signal(db_path, sent=True)
         executor = BotExecutor(db_path)
         executor._initialized = True
-        executor._clob = AsyncMock()
-        executor._clob.resolve_token_id.return_value = _make_market_info(
-            minimum_order_size=5.0
+        executor._clob = _StubClob(
+            market_info=_make_market_info(minimum_order_size=5.0)
         )
 
         signal = executor._get_tradeable_signals()[0]
@@ -172,10 +187,11 @@ class TestExecuteTrade:
         _seed_signal(db_path, sent=True)
         executor = BotExecutor(db_path)
         executor._initialized = True
-        executor._clob = AsyncMock()
-        executor._clob.resolve_token_id.return_value = _make_market_info()
-        executor._clob.get_current_price.return_value = 0.50
-        executor._clob.get_balance.return_value = 1.0  # Below min balance
+        executor._clob = _StubClob(
+            market_info=_make_market_info(),
+            price=0.50,
+            balance=1.0,  # Below min balance
+        )
 
         signal = executor._get_tradeable_signals()[0]
         result = await executor._execute_trade(signal)
@@ -186,12 +202,13 @@ class TestExecuteTrade:
         _seed_signal(db_path, sent=True)
         executor = BotExecutor(db_path)
         executor._initialized = True
-        executor._clob = AsyncMock()
-        executor._clob.resolve_token_id.return_value = _make_market_info()
-        executor._clob.get_current_price.return_value = 0.50
-        executor._clob.get_balance.return_value = 8.0
-        executor._clob.place_market_order.return_value = OrderResult(
-            success=False, error_message="Insufficient liquidity"
+        executor._clob = _StubClob(
+            market_info=_make_market_info(),
+            price=0.50,
+            balance=8.0,
+            order_result=OrderResult(
+                success=False, error_message="Insufficient liquidity"
+            ),
         )
 
         signal = executor._get_tradeable_signals()[0]
@@ -207,8 +224,7 @@ class TestExecuteTrade:
         _seed_signal(db_path, sent=True)
         executor = BotExecutor(db_path)
         executor._initialized = True
-        executor._clob = AsyncMock()
-        executor._clob.resolve_token_id.return_value = None
+        executor._clob = _StubClob(market_info=None)
 
         signal = executor._get_tradeable_signals()[0]
         result = await executor._execute_trade(signal)
@@ -219,29 +235,15 @@ class TestExecuteTrade:
 class TestProcessResolutions:
     async def test_win(self, db_path):
         sid = _seed_signal(db_path, sent=True)
-        # Insert open trade
-        conn = _get_connection(db_path)
-        try:
-            conn.execute(
-                "INSERT INTO bot_trades (signal_id, condition_id, market_title, "
-                "direction, status, entry_price, cost_usd, shares, "
-                "created_at, updated_at) "
-                "VALUES (?, 'c_test', 'Test', 'YES', 'OPEN', 0.40, 0.50, 1.25, ?, ?)",
-                (sid, datetime.utcnow().isoformat(), datetime.utcnow().isoformat()),
-            )
-            # Mark signal as resolved YES
-            conn.execute(
-                "UPDATE signals SET resolved_at = ?, resolution_outcome = 'YES' "
-                "WHERE id = ?",
-                (datetime.utcnow().isoformat(), sid),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        # Open trade on a signal that has since resolved YES
+        _seed_trade(
+            db_path, sid, resolution="YES",
+            market_title="Test", entry_price=0.40, cost_usd=0.50, shares=1.25,
+        )
 
         executor = BotExecutor(db_path)
         executor._initialized = True
-        executor._clob = AsyncMock()
+        executor._clob = _StubClob()
         count = await executor.process_resolutions()
         assert count == 1
 
@@ -252,27 +254,15 @@ class TestProcessResolutions:
 
     async def test_loss(self, db_path):
         sid = _seed_signal(db_path, sent=True)
-        conn = _get_connection(db_path)
-        try:
-            conn.execute(
-                "INSERT INTO bot_trades (signal_id, condition_id, market_title, "
-                "direction, status, entry_price, cost_usd, shares, "
-                "created_at, updated_at) "
-                "VALUES (?, 'c_test', 'Test', 'YES', 'OPEN', 0.40, 0.50, 1.25, ?, ?)",
-                (sid, datetime.utcnow().isoformat(), datetime.utcnow().isoformat()),
-            )
-            conn.execute(
-                "UPDATE signals SET resolved_at = ?, resolution_outcome = 'NO' "
-                "WHERE id = ?",
-                (datetime.utcnow().isoformat(), sid),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        # Open trade on a signal that has since resolved NO
+        _seed_trade(
+            db_path, sid, resolution="NO",
+            market_title="Test", entry_price=0.40, cost_usd=0.50, shares=1.25,
+        )
 
         executor = BotExecutor(db_path)
         executor._initialized = True
-        executor._clob = AsyncMock()
+        executor._clob = _StubClob()
         count = await executor.process_resolutions()
         assert count == 1
 
@@ -285,21 +275,11 @@ class TestProcessResolutions:
 class TestRecoverUnconfirmed:
     async def test_recover_with_order_id(self, db_path):
         sid = _seed_signal(db_path, sent=True)
-        conn = _get_connection(db_path)
-        try:
-            conn.execute(
-                "INSERT INTO bot_trades (signal_id, condition_id, direction, "
-                "order_id, status, created_at, updated_at) "
-                "VALUES (?, 'c_test', 'YES', 'ord_123', 'PLACED', ?, ?)",
-                (sid, datetime.utcnow().isoformat(), datetime.utcnow().isoformat()),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        _seed_trade(db_path, sid, status="PLACED", order_id="ord_123")
 
         executor = BotExecutor(db_path)
         executor._initialized = True
-        executor._clob = AsyncMock()
+        executor._clob = _StubClob()
         await executor._recover_unconfirmed()
 
         trades = _get_bot_trades(db_path)
@@ -307,21 +287,11 @@ class TestRecoverUnconfirmed:
 
     async def test_recover_without_order_id(self, db_path):
         sid = _seed_signal(db_path, sent=True)
-        conn = _get_connection(db_path)
-        try:
-            conn.execute(
-                "INSERT INTO bot_trades (signal_id, condition_id, direction, "
-                "status, created_at, updated_at) "
-                "VALUES (?, 'c_test', 'YES', 'PLACED', ?, ?)",
-                (sid, datetime.utcnow().isoformat(), datetime.utcnow().isoformat()),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        _seed_trade(db_path, sid, status="PLACED")
 
         executor = BotExecutor(db_path)
         executor._initialized = True
-        executor._clob = AsyncMock()
+        executor._clob = _StubClob()
         await executor._recover_unconfirmed()
 
         trades = _get_bot_trades(db_path)
@@ -338,6 +308,6 @@ class TestExecuteOnNewSignals:
     async def test_no_signals(self, db_path):
         executor = BotExecutor(db_path)
         executor._initialized = True
-        executor._clob = AsyncMock()
+        executor._clob = _StubClob()
         result = await executor.execute_on_new_signals()
         assert result["traded"] == 0
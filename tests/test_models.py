@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from db.models import (
     init_db,
     upsert_trader,
+    upsert_traders,
     get_traders,
     get_trader,
     insert_snapshots,
@@ -17,6 +18,9 @@ from db.models import (
     get_active_signal,
     get_unsent_signals,
     mark_signal_sent,
+    get_signal_directions,
+    update_signal_market_prices,
+    _get_connection,
 )
 
 
@@ -39,7 +43,7 @@ def _make_trader(wallet="0xAAA", score=5.0, **overrides):
 
 class TestInitDb:
     def test_creates_all_tables(self, db_path):
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(db_path, uri=True)
         tables = [
             r[0] for r in conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
@@ -54,7 +58,7 @@ class TestInitDb:
         assert "bot_state" in tables
 
     def test_creates_indexes(self, db_path):
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(db_path, uri=True)
         indexes = [
             r[0] for r in conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'"
@@ -66,7 +70,7 @@ class TestInitDb:
     def test_idempotent(self, db_path):
         init_db(db_path)
         init_db(db_path)
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(db_path, uri=True)
         tables = conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
         ).fetchall()
@@ -90,6 +94,21 @@ class TestTraders:
         assert traders[0]["trader_score"] == 9.0
         assert traders[0]["username"] == "updated"
 
+    def test_upsert_many(self, db_path):
+        upsert_trader(db_path, _make_trader("0xA", score=1.0))
+        upsert_traders(db_path, [
+            _make_trader("0xA", score=7.0, username="renamed"),
+            _make_trader("0xB", score=4.0),
+        ])
+        traders = get_traders(db_path)
+        assert [t["wallet_address"] for t in traders] == ["0xA", "0xB"]
+        assert traders[0]["username"] == "renamed"
+        assert json.loads(traders[1]["category_scores"]) == {"POLITICS": 4.0}
+
+    def test_upsert_many_empty(self, db_path):
+        upsert_traders(db_path, [])
+        assert get_traders(db_path) == []
+
     def test_get_trader_by_address(self, db_path):
         upsert_trader(db_path, _make_trader("0xAAA"))
         upsert_trader(db_path, _make_trader("0xBBB", score=3.0))
@@ -272,6 +291,28 @@ class TestSignals:
         found = get_active_signal(db_path, "c1", "YES", since)
         assert found is None
 
+    def test_get_signal_directions(self, db_path):
+        yes_id = insert_signal(db_path, self._make_signal(direction="YES"))
+        no_id = insert_signal(db_path, self._make_signal(condition_id="c2", direction="NO"))
+        found = get_signal_directions(db_path, [yes_id, no_id, 999])
+        assert found == {yes_id: "YES", no_id: "NO"}
+        assert get_signal_directions(db_path, []) == {}
+
+    def test_update_signal_market_prices(self, db_path):
+        first = insert_signal(db_path, self._make_signal())
+        second = insert_signal(db_path, self._make_signal(condition_id="c2"))
+        update_signal_market_prices(db_path, [(first, 0.35), (second, 0.8)])
+        conn = _get_connection(db_path)
+        try:
+            rows = conn.execute(
+                "SELECT id, market_price_at_signal FROM signals ORDER BY id"
+            ).fetchall()
+        finally:
+            conn.close()
+        assert [(r["id"], r["market_price_at_signal"]) for r in rows] == [
+            (first, 0.35), (second, 0.8),
+        ]
+
     def test_traders_involved_json_roundtrip(self, db_path):
         traders = [{"wallet": "0xA", "score": 5.0}, {"wallet": "0xB", "score": 3.0}]
         sid = insert_signal(db_path, self._make_signal(traders_involved=traders))
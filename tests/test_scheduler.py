@@ -0,0 +1,123 @@
+"""Tests for scheduler.py — market price enrichment with a stubbed Gamma client."""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+import scheduler
+from db.models import _get_connection, insert_signal
+from scheduler import RadarScheduler
+
+
+class _StubGamma:
+    """Returns a canned market (or raises a canned exception) per condition_id."""
+
+    def __init__(self, markets: dict):
+        self.markets = markets
+        self.requested = []
+
+    async def get_market_by_condition(self, condition_id):
+        self.requested.append(condition_id)
+        market = self.markets.get(condition_id, {})
+        if isinstance(market, Exception):
+            raise market
+        return market
+
+
+def _seed_signal(db_path, condition_id, direction="YES"):
+    now = datetime.utcnow().isoformat()
+    sid = insert_signal(db_path, {
+        "condition_id": condition_id,
+        "direction": direction,
+        "traders_involved": [],
+        "created_at": now,
+        "updated_at": now,
+    })
+    return {"id": sid, "condition_id": condition_id, "new": True}
+
+
+def _market_prices(db_path):
+    conn = _get_connection(db_path)
+    try:
+        rows = conn.execute("SELECT condition_id, market_price_at_signal FROM signals").fetchall()
+        return {r["condition_id"]: r["market_price_at_signal"] for r in rows}
+    finally:
+        conn.close()
+
+
+def _scheduler(db_path, markets):
+    radar = RadarScheduler(db_path)
+    radar.gamma_api = _StubGamma(markets)
+    return radar
+
+
+@pytest.mark.asyncio
+class TestEnrichMarketPrices:
+    async def test_stores_price_of_signal_side(self, db_path):
+        signals = [_seed_signal(db_path, "c_yes", "YES"), _seed_signal(db_path, "c_no", "NO")]
+        radar = _scheduler(db_path, {
+            "c_yes": {"outcomePrices": "[0.35, 0.65]"},
+            "c_no": {"outcomePrices": [0.2, 0.8]},
+        })
+        await radar._enrich_market_prices(signals)
+        assert _market_prices(db_path) == {"c_yes": 0.35, "c_no": 0.8}
+
+    async def test_fetch_error_skips_only_that_signal(self, db_path):
+        signals = [_seed_signal(db_path, "c_err"), _seed_signal(db_path, "c_ok")]
+        radar = _scheduler(db_path, {
+            "c_err": RuntimeError("Gamma timeout"),
+            "c_ok": {"outcomePrices": "[0.4, 0.6]"},
+        })
+        await radar._enrich_market_prices(signals)
+        assert _market_prices(db_path) == {"c_err": None, "c_ok": 0.4}
+
+    async def test_malformed_outcome_prices_skipped(self, db_path):
+        signals = [
+            _seed_signal(db_path, "c_bad_json"),
+            _seed_signal(db_path, "c_short"),
+            _seed_signal(db_path, "c_empty"),
+            _seed_signal(db_path, "c_ok"),
+        ]
+        radar = _scheduler(db_path, {
+            "c_bad_json": {"outcomePrices": "not json"},
+            "c_short": {"outcomePrices": "[0.5]"},
+            "c_empty": {},
+            "c_ok": {"outcomePrices": "[0.7, 0.3]"},
+        })
+        await radar._enrich_market_prices(signals)
+        assert _market_prices(db_path) == {
+            "c_bad_json": None, "c_short": None, "c_empty": None, "c_ok": 0.7,
+        }
+
+    async def test_missing_row_not_fetched(self, db_path):
+        signals = [
+            _seed_signal(db_path, "c_ok"),
+            {"id": 999, "condition_id": "c_gone", "new": True},
+        ]
+        radar = _scheduler(db_path, {"c_ok": {"outcomePrices": "[0.4, 0.6]"}})
+        await radar._enrich_market_prices(signals)
+        assert radar.gamma_api.requested == ["c_ok"]
+        assert _market_prices(db_path) == {"c_ok": 0.4}
+
+    async def test_select_error_is_logged_not_raised(self, db_path, monkeypatch, caplog):
+        def _locked(*args):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(scheduler, "get_signal_directions", _locked)
+        signals = [_seed_signal(db_path, "c_ok")]
+        radar = _scheduler(db_path, {"c_ok": {"outcomePrices": "[0.4, 0.6]"}})
+        await radar._enrich_market_prices(signals)
+        assert radar.gamma_api.requested == []
+        assert "database is locked" in caplog.text
+
+    async def test_update_error_is_logged_not_raised(self, db_path, monkeypatch, caplog):
+        def _locked(*args):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(scheduler, "update_signal_market_prices", _locked)
+        signals = [_seed_signal(db_path, "c_ok")]
+        radar = _scheduler(db_path, {"c_ok": {"outcomePrices": "[0.4, 0.6]"}})
+        await radar._enrich_market_prices(signals)
+        assert _market_prices(db_path) == {"c_ok": None}
+        assert "database is locked" in caplog.text
@@ -1,3 +1,5 @@
+import math
+
 import pytest
 
 from modules.watchlist_builder import (
@@ -9,6 +11,7 @@ from modules.watchlist_builder import (
     calc_volume_weight,
     calc_avg_position_size,
     calc_category_scores,
+    collect_closed_stats,
     WatchlistBuilder,
 )
 
@@ -194,6 +197,10 @@ class TestCalcAvgPositionSize:
         trades = [{"usdcSize": "0"}, {"usdcSize": "100"}]
         assert calc_avg_position_size(trades) == 100.0
 
+    def test_null_size_excluded(self):
+        trades = [{"usdcSize": None}, {"usdcSize": "100"}]
+        assert calc_avg_position_size(trades) == 100.0
+
     def test_empty(self):
         assert calc_avg_position_size([]) == 0.0
 
@@ -224,6 +231,41 @@ class TestCalcCategoryScores:
         assert len(scores) == 0
 
 
+class TestCollectClosedStats:
+    def test_aggregates(self):
+        positions = [
+            {"realizedPnl": "10", "totalBought": "100", "avgPrice": "0.3",
+             "outcome": "YES", "title": "Trump wins?"}
+            for _ in range(8)
+        ] + [
+            {"realizedPnl": "-20", "totalBought": "50", "avgPrice": "0.6",
+             "outcome": "NO", "title": "Trump wins?"}
+            for _ in range(4)
+        ] + [
+            {"realizedPnl": "5", "totalBought": "25", "avgPrice": "0.8",
+             "outcome": "NO", "eventTitle": "Bitcoin above 100k?"},
+        ]
+        stats = collect_closed_stats(positions)
+        assert stats.total == 13
+        assert stats.win_rate == pytest.approx(9 / 13)
+        assert stats.roi == pytest.approx(5 / 1025)
+        # Winners: 8 YES @ 0.3 -> 0.7 each, 1 NO @ 0.8 -> 0.8
+        assert stats.timing_quality == pytest.approx(6.4 / 9)
+        assert stats.volume_weight == pytest.approx(math.log2(1025))
+        # POLITICS: 12 positions, WR 8/12, zero net P&L; CRYPTO has too few
+        assert stats.category_scores() == {
+            "POLITICS": round(calc_consistency(8 / 12, 12), 2),
+        }
+
+    def test_empty(self):
+        stats = collect_closed_stats([])
+        assert stats.win_rate == 0.0
+        assert stats.roi == 0.0
+        assert stats.timing_quality == 0.0
+        assert stats.volume_weight == 0.0
+        assert stats.category_scores() == {}
+
+
 class TestNormalizeRoi:
     def test_basic(self):
         traders = [